@@ -7,7 +7,15 @@ used by the ColumnsProcessing pipeline. The business logic that maps
 implemented in `helpers.py`.
 """
 
-from typing import Dict, List, Tuple
+from __future__ import annotations
+
+import functools
+import re
+import sys
+import warnings
+
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple
 
 # Input column names (columns to read from source CSV)
 INPUT_ITEM_TYPE = "ItemType"
@@ -26,7 +34,7 @@ MPL_DESC_COLUMN = "MPL_DESCRIPTION"
 # Mapping: Account Description -> Account Code
 # account_desc_to_code_map: Dict[str, str] = {
 #     "Specialty Walls": "61.06.06",
-#     "Anchor Bolts": "81.30.02",
+#     "Anchor Bolts": "61.30.02",
 #     "Structural Steel Industrial Structures": "62.03.02",
 #     "Module Assembly": "62.03.04",
 #     "Stairs": "62.18.04",
@@ -36,7 +44,7 @@ MPL_DESC_COLUMN = "MPL_DESCRIPTION"
 #     "Electrical Devices": "81.27.02",
 #     "Specialty Systems - Plant Communications": "81.33.02",
 #     "Specialty Systems - Distributed Antenna System (DAS)": "81.33.04",
-#     "Curtain Wall and Glazed Assemblies Subcontracts": "95.03.00.006.04",
+#     "Curtain Wall and Glazed Assemblies Subcontracts": "95.83.08.006.04",
 #     "Permanent Fences and Gates": "55.12.10",
 #     "Concrete Cylinder Piles": "60.03.16",
 #     "Caisson - Concrete": "60.09.02",
@@ -71,7 +79,7 @@ MPL_DESC_COLUMN = "MPL_DESCRIPTION"
 #     "62.18.14": ["M2"],
 #     "81.06.06": ["Ea"],
 #     "81.27.02": ["Ea"],
-#     "8Good.33.02": ["Ea"],
+#     "81.33.02": ["Ea"],
 #     "81.33.24": ["Ea"],
 #     "95.83.08.006.04": ["M2"]   
 # }
@@ -337,34 +345,9 @@ description_to_items: Dict[Tuple[str, str, str], List[str]] = {
         "Walls: Basic Wall: DP-SC",
         "Walls: Basic Wall: SCCV DP-SC",
         "Walls: Basic Wall: PEDESTAL DP-SC",
-        "Walls: Basic Wall: SCCV DP-SC",
-        "Walls: Basic Wall: Shield DP-SC",
-        "Walls: Basic Wall: DP-SC",
-        "Walls: Basic Wall: SCCV DP-SC",
-        "Walls: Basic Wall: PEDESTAL DP-SC",
-        "Walls: Basic Wall: SCCV DP-SC",
         "Walls: Basic Wall: Shield DP-SC"
     ],
     ("Tunnel Concrete", "85.12.04", "M3"):     [
-        "Generic Models: Tunnel",
-        "Structural Foundations: Foundation Slab: Concrete Slab -1000 mm",
-        "Structural Foundations: Foundation Slab: Mud Slab - 75mm",
-        "Walls: Basic Wall: Concrete - Cast in Place - 1000mm",
-        "Generic Models: Slab Void: Slab Void",
-        "Generic Models: panel: panel",
-        "Generic Models: interface: interface",
-        "Generic Models: Pipes horizontal: 10x2x200",
-        "Structural Foundations: Foundation Slab: Slab on Grade - Concrete - 650mm",
-        "Walls: Basic Wall: SHAFT WALL - 600mm",
-        "Walls: Basic Wall: SHAFT WALL - 12 Conc",
-        "Generic Models: Connection Pipe to Tunnel",
-        "Generic Models: lower pipe",
-        "Generic Models: concrete: concrete",
-        "Walls: Basic Wall: SHAFT WALL - 220 Conc",
-        "Generic Models: 6050 tunnel: 6050 tunnel",
-        "Walls: Basic Wall: SHAFT WALL - 75",
-        "Walls: Basic Wall: SHAFT WALL - 87 Conc",
-        "Generic Models: BASE: 1036 tunnel",
         "Generic Models: Tunnel",
         "Structural Foundations: Foundation Slab: Concrete Slab -1000 mm",
         "Structural Foundations: Foundation Slab: Mud Slab - 75mm",
@@ -613,24 +596,63 @@ mpl_map: Dict[str, str] = {
     "Y99": "YARD/BOP",
 }
 
+# Sanity-check the account codes once at import so a typo in the table
+# (e.g. a transposed digit or stray letter) fails loudly here instead of
+# silently producing bad codes downstream. "missing info" is a deliberate
+# placeholder for accounts that have no code yet.
+_ACCOUNT_CODE_FORMAT = re.compile(r"\d{2}(\.\d{2,3})*")
+for (_desc, _code, _uom) in description_to_items:
+    if _code != "missing info" and _ACCOUNT_CODE_FORMAT.fullmatch(_code) is None:
+        raise ValueError(
+            f"Malformed account code {_code!r} for {_desc!r} in description_to_items"
+        )
+del _desc, _code, _uom
+
+# Both reference maps are read-only after import; interned keys give dict
+# lookups the pointer-identity fast path and the proxy prevents mutation
+description_to_items = MappingProxyType(description_to_items)
+mpl_map = MappingProxyType({sys.intern(k): v for k, v in mpl_map.items()})
+
+# Optional pandas companion for bulk consumers: Series.map(pd.Series) takes
+# a take-based fast path that is faster than Series.map(dict) on large
+# frames. Resolved lazily (see get_mpl_series below) so the stdlib-only
+# scripts never pay the pandas import at startup; the scripts themselves
+# stay stdlib-only either way.
+
+# Recommended dtype for the enrichment output columns when a DataFrame
+# consumer materializes them (requires pandas with pyarrow>=7 installed).
+# Arrow-backed strings sit in contiguous buffers instead of one PyObject
+# per cell, cutting memory several-fold on the 372k-row workload. The
+# stdlib CSV scripts never allocate these columns themselves, so they
+# only export the name for consistency across consumers.
+OUTPUT_STRING_DTYPE = "string[pyarrow]"
+
 
 # ============================================================================
 # PERFORMANCE OPTIMIZATION: Pre-computed Normalized Lookups
 # ============================================================================
 
+# Translation table deleting all whitespace characters in one C-level pass
+_WS_TABLE = str.maketrans("", "", " \t\n\r\x0b\x0c")
+
+
 def _normalize_string(s: str) -> str:
     """
     Normalize a string by removing all whitespace and converting to lowercase.
-    
+
     This normalization is used for fuzzy matching of ItemType values.
-    
+    Implemented as casefold() plus a precomputed translation table, which
+    runs in two C-level passes with no intermediate token list (unlike
+    lower/split/join). casefold() is also the correct case-insensitive
+    fold for non-ASCII text.
+
     Args:
         s: String to normalize
-        
+
     Returns:
         Normalized string with no whitespace and all lowercase
     """
-    return "".join(s.lower().split())
+    return s.casefold().translate(_WS_TABLE)
 
 
 def _build_normalized_keyword_lookup() -> Dict[str, Tuple[str, str, str]]:
@@ -649,15 +671,36 @@ def _build_normalized_keyword_lookup() -> Dict[str, Tuple[str, str, str]]:
         Format: {normalized_keyword: (account_description, account_code, uom)}
     """
     lookup: Dict[str, Tuple[str, str, str]] = {}
-    
+
     for account_details, keywords in description_to_items.items():
-        for keyword in keywords:
-            normalized_keyword = _normalize_string(keyword)
+        # Intern the short repeated strings ("M3", "EA", account codes...) so
+        # every entry - and every row of the enriched output - shares a single
+        # object per distinct value instead of duplicating it
+        account_details = tuple(sys.intern(part) for part in account_details)
+        # Dedupe the raw list (several entries repeat keywords verbatim) and
+        # order longest-first so downstream matchers see the most specific
+        # patterns with the highest priority. dict.fromkeys instead of set:
+        # it preserves first-seen order, so equal-length keywords sort the
+        # same way on every run regardless of PYTHONHASHSEED and a
+        # regenerated constants_generated.py stays byte-stable.
+        for keyword in sorted(dict.fromkeys(keywords), key=len, reverse=True):
+            # Interned keys hit CPython's pointer-identity fast path on
+            # every subsequent dict lookup
+            normalized_keyword = sys.intern(_normalize_string(keyword))
             if normalized_keyword:
                 # Store first match (in case of duplicates, first one wins)
                 if normalized_keyword not in lookup:
                     lookup[normalized_keyword] = account_details
-    
+                elif lookup[normalized_keyword] != account_details:
+                    # Same keyword claimed by two different accounts: keep the
+                    # first one, but say so instead of silently dropping it
+                    warnings.warn(
+                        f"Keyword {keyword!r} maps to both "
+                        f"{lookup[normalized_keyword]} and {account_details}; "
+                        "keeping the first",
+                        stacklevel=2,
+                    )
+
     return lookup
 
 
@@ -674,6 +717,268 @@ def _build_normalized_skip_list() -> List[str]:
     return [_normalize_string(item) for item in item_type_to_skip if item]
 
 
-# Pre-compute lookups at module import time (computed once)
-normalized_keyword_lookup: Dict[str, Tuple[str, str, str]] = _build_normalized_keyword_lookup()
-normalized_skip_list: List[str] = _build_normalized_skip_list()
+def _source_fingerprint() -> str:
+    """
+    Fingerprint the source tables the generated lookups are derived from.
+
+    Used to detect a stale constants_generated.py after description_to_items
+    or item_type_to_skip change without re-running gen_constants.py.
+
+    Returns:
+        Hex digest over the repr of both source tables
+    """
+    import hashlib
+
+    payload = repr(sorted(description_to_items.items())) + repr(item_type_to_skip)
+    return hashlib.md5(payload.encode("utf-8")).hexdigest()
+
+
+@functools.cache
+def _load_generated_lookups():
+    """
+    Load the pre-generated normalized lookups emitted by gen_constants.py.
+
+    Skips the import-time normalization work entirely when an up-to-date
+    constants_generated.py is present next to this module.
+
+    Returns:
+        (normalized_keyword_lookup, normalized_skip_list) as plain literals,
+        or None when the generated module is missing or stale
+    """
+    try:
+        import constants_generated as generated
+    except ImportError:
+        return None
+    if getattr(generated, "SOURCE_FINGERPRINT", None) != _source_fingerprint():
+        warnings.warn(
+            "constants_generated.py is stale; rebuilding lookups on first use "
+            "(re-run gen_constants.py to refresh it)",
+            stacklevel=2,
+        )
+        return None
+    return generated.NORMALIZED_KEYWORD_LOOKUP, generated.NORMALIZED_SKIP_LIST
+
+
+# The derived lookups below are built lazily on first use rather than at
+# import, so tools that import this module only for the column names or
+# mpl_map (e.g. worker bootstrap, reporting scripts) pay nothing for the
+# enrichment machinery. Each getter is wrapped in functools.cache, which
+# makes the build a one-time cost per process; module __getattr__ at the
+# bottom keeps the original attribute names working for existing callers.
+
+@functools.cache
+def get_keyword_lookup() -> Mapping[str, Tuple[str, str, str]]:
+    """
+    Return the normalized keyword -> (description, code, uom) lookup.
+
+    Prefers the pre-generated literal copy (see gen_constants.py); falls
+    back to building it from description_to_items. The read-only
+    MappingProxyType view guards against accidental mutation that would
+    invalidate the derived indexes built from it.
+    """
+    generated = _load_generated_lookups()
+    if generated is not None:
+        return MappingProxyType(
+            {
+                sys.intern(k): tuple(sys.intern(part) for part in v)
+                for k, v in generated[0].items()
+            }
+        )
+    return MappingProxyType(_build_normalized_keyword_lookup())
+
+
+@functools.cache
+def get_skip_list() -> Tuple[str, ...]:
+    """
+    Return the normalized skip-list entries as an immutable tuple.
+    """
+    generated = _load_generated_lookups()
+    if generated is not None:
+        return tuple(generated[1])
+    return tuple(_build_normalized_skip_list())
+
+
+@functools.cache
+def _build_keyword_index() -> Tuple[Dict[str, int], Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Build a struct-of-arrays index over the keyword lookup.
+
+    Instead of resolving a keyword to a three-string tuple, bulk consumers
+    can resolve it to a single integer index into three parallel columns
+    (description, code, uom). Columnar consumers (e.g. a pandas pipeline)
+    can then attach all three output columns with one vectorized take per
+    column rather than unpacking a Python tuple per row.
+
+    Returns:
+        (nkey_to_idx, desc_table, code_table, uom_table) where nkey_to_idx
+        maps a normalized keyword to the shared row index of the three tables
+    """
+    nkey_to_idx: Dict[str, int] = {}
+    descs: List[str] = []
+    codes: List[str] = []
+    uoms: List[str] = []
+    for index, (norm_keyword, (desc, code, uom)) in enumerate(get_keyword_lookup().items()):
+        nkey_to_idx[norm_keyword] = index
+        descs.append(desc)
+        codes.append(code)
+        uoms.append(uom)
+    return nkey_to_idx, tuple(descs), tuple(codes), tuple(uoms)
+
+
+@functools.cache
+def get_keyword_pattern() -> "re.Pattern[str]":
+    """
+    Return one alternation regex over all normalized keywords.
+
+    Alternatives are ordered longest-first, but that only guarantees the
+    longest keyword wins among matches starting at the same position:
+    re's leftmost-match semantics mean a shorter keyword earlier in the
+    string beats a longer keyword later in it, which can disagree with
+    the longest-match-wins rule of the per-row scan when keywords
+    overlap. Use this as a presence prefilter (any match / no match),
+    not to extract which keyword matched - resolve that through
+    compute_account_from_item_type or the keyword lookup instead.
+    """
+    return re.compile(
+        "(" + "|".join(
+            re.escape(k) for k in sorted(get_keyword_lookup(), key=len, reverse=True)
+        ) + ")"
+    )
+
+
+@functools.cache
+def get_skip_pattern() -> "re.Pattern[str]":
+    """
+    Return one alternation regex over the skip list: a single C-level
+    search per row replaces a Python-level scan over every skip entry.
+    """
+    return re.compile("|".join(re.escape(s) for s in get_skip_list()))
+
+
+@functools.cache
+def _get_skip_exact() -> frozenset:
+    """
+    Frozenset of skip entries for the exact-match fast path: many skipped
+    rows carry an ItemType that IS a skip entry (e.g. "Lines", "Rooms"),
+    and a hash probe is cheaper than even one regex search. Every exact
+    hit is by definition also a substring hit, so this changes nothing
+    about which rows are skipped.
+    """
+    return frozenset(get_skip_list())
+
+
+@functools.cache
+def _get_min_skip_len() -> int:
+    """
+    Length of the shortest skip-list entry: any normalized ItemType
+    shorter than this cannot contain a skip substring, so the whole
+    check short-circuits without touching the set or the regex.
+    """
+    return min(map(len, get_skip_list()), default=1)
+
+
+def should_skip(normalized_item_type: str) -> bool:
+    """
+    Check whether a normalized ItemType contains any skip-list substring.
+
+    Values too short to hold any skip entry return immediately; otherwise
+    an O(1) frozenset probe handles the exact-match case before falling
+    back to the compiled substring alternation.
+
+    Args:
+        normalized_item_type: ItemType already normalized via _normalize_string
+
+    Returns:
+        True if any skip substring occurs in the normalized ItemType
+    """
+    if len(normalized_item_type) < _get_min_skip_len():
+        return False
+    if normalized_item_type in _get_skip_exact():
+        return True
+    return get_skip_pattern().search(normalized_item_type) is not None
+
+
+# Optional C-extension accelerator: when pyahocorasick is installed, all
+# normalized keywords are compiled into a single Aho-Corasick automaton so
+# each row needs one linear pass over its ItemType instead of one substring
+# scan per keyword. Falls back to the pure-Python loop when unavailable.
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+@functools.cache
+def get_mpl_series():
+    """
+    Return mpl_map as a pandas Series for bulk consumers, or None when
+    pandas is not installed.
+
+    The pandas import happens here, on first access, so the stdlib-only
+    scripts never pay it at startup even on machines where pandas exists.
+    """
+    try:
+        import pandas as pd
+    except ImportError:
+        return None
+    series = pd.Series(dict(mpl_map), name=MPL_DESC_COLUMN)
+    series.index = series.index.astype("string")
+    return series
+
+
+@functools.cache
+def get_keyword_automaton():
+    """
+    Build an Aho-Corasick automaton over all normalized keywords.
+
+    The automaton matches every dictionary keyword in a single O(n) pass
+    over the normalized ItemType, independent of how many keywords exist.
+    Each matched word carries its rank in the longest-first scan order
+    plus the account details tuple: taking the minimum rank over all
+    matches reproduces the scan's longest-match-wins rule exactly,
+    including how ties between equal-length keywords resolve (first in
+    table order), so results cannot depend on whether pyahocorasick is
+    installed.
+
+    Returns:
+        The compiled automaton, or None if pyahocorasick is not installed
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    ranked = sorted(
+        get_keyword_lookup().items(), key=lambda kv: len(kv[0]), reverse=True
+    )
+    for rank, (norm_keyword, account_details) in enumerate(ranked):
+        automaton.add_word(norm_keyword, (rank, account_details))
+    automaton.make_automaton()
+    return automaton
+
+
+# Legacy module-level names, now resolved lazily (PEP 562). The first
+# access runs the cached getter and then binds the result into globals()
+# so every later access is an ordinary module-attribute lookup again.
+_LAZY_ATTRS = {
+    "normalized_keyword_lookup": get_keyword_lookup,
+    "normalized_skip_list": get_skip_list,
+    "keyword_pattern": get_keyword_pattern,
+    "skip_pattern": get_skip_pattern,
+    "keyword_automaton": get_keyword_automaton,
+    "mpl_series": get_mpl_series,
+}
+
+_INDEX_ATTRS = ("nkey_to_idx", "desc_table", "code_table", "uom_table")
+
+
+def __getattr__(name: str):
+    if name in _INDEX_ATTRS:
+        values = dict(zip(_INDEX_ATTRS, _build_keyword_index()))
+        globals().update(values)
+        return values[name]
+    try:
+        getter = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getter()
+    globals()[name] = value
+    return value
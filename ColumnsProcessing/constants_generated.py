@@ -0,0 +1,304 @@
+"""
+Pre-built normalized lookups. GENERATED by gen_constants.py - do not edit.
+"""
+
+SOURCE_FINGERPRINT = '5b14eff778ab3bcc76e1814dc0cad4ac'
+
+NORMALIZED_KEYWORD_LOOKUP = {'acppstructurebeam': ('Module Assembly - Misc Steel Fab', '62.03.04.024', 'Ton'),
+ 'acppstructureladder': ('Ladders', '62.18.06', 'LM'),
+ 'ladder': ('Ladders', '62.18.06', 'LM'),
+ 'floors:floor:metalfloorassembly': ('Gratings', '62.18.14', 'M2'),
+ 'mtlfloorassembly': ('Gratings', '62.18.14', 'M2'),
+ 'grating': ('Gratings', '62.18.14', 'M2'),
+ 'grate': ('Gratings', '62.18.14', 'M2'),
+ 'acppstructurestair': ('Stairs', '62.18.04', 'LM'),
+ 'assembledstair': ('Stairs', '62.18.04', 'LM'),
+ 'acppstructureanchorage': ('Pedestal', '61.06.12', 'M3'),
+ 'acppstructureplate': ('Module Assembly - Platework', '62.03.04.020', 'Ton'),
+ 'exhaustlouvre': ('Building HVAC - Grills and Diffuser Installation', '83.23.22', 'EA'),
+ 'airterminal': ('Building HVAC - Grills and Diffuser Installation', '83.23.22', 'EA'),
+ 'exhaustfan': ('Building HVAC - Grills and Diffuser Installation', '83.23.22', 'EA'),
+ 'airlouvre': ('Building HVAC - Grills and Diffuser Installation', '83.23.22', 'EA'),
+ 'daikin': ('Building HVAC - Grills and Diffuser Installation', '83.23.22', 'EA'),
+ 'grille': ('Building HVAC - Grills and Diffuser Installation', '83.23.22', 'EA'),
+ 'fancoil': ('Building HVAC - Fan Installation', '83.23.24', 'EA'),
+ 'fan': ('Building HVAC - Fan Installation', '83.23.24', 'EA'),
+ 'mechanicalequipment:air_handling_unit-vertical-daikin-fxtq_tavju:5ton_fxtq60tavjua': ('Building '
+                                                                                        'HVAC - '
+                                                                                        'Ventilation '
+                                                                                        'Unit',
+                                                                                        '83.23.42',
+                                                                                        'EA'),
+ 'mechanicalequipment:nuclearproject-aaf': ('Building HVAC - Ventilation Unit', '83.23.42', 'EA'),
+ 'mechanicalequipment:rwbroofdesign_ahu:': ('Building HVAC - Ventilation Unit', '83.23.42', 'EA'),
+ 'mechanicalequipment:ftrn:': ('Building HVAC - Ventilation Unit', '83.23.42', 'EA'),
+ 'afusystems:': ('Building HVAC - Ventilation Unit', '83.23.42', 'EA'),
+ 'ahu-': ('Building HVAC - Ventilation Unit', '83.23.42', 'EA'),
+ 'ahus': ('Building HVAC - Ventilation Unit', '83.23.42', 'EA'),
+ 'ahu': ('Building HVAC - Ventilation Unit', '83.23.42', 'EA'),
+ 'mechanicalequipment': ('Building HVAC - Misc. Equipment', '83.23.32', 'EA'),
+ 'cabletrayfittings': ('Cable Tray Supports / Cable Supports', '81.06.06', 'Ea'),
+ 'electricalfixtures': ('Electrical Devices', '81.27.02', 'Ea'),
+ 'ceiling_speaker': ('Specialty Systems - Plant Communications', '81.33.02', 'Ea'),
+ 'radio_indoor_antenna': ('Specialty Systems - Distributed Antenna System (DAS)', '81.33.24', 'Ea'),
+ 'curtainpanels:': ('Curtain Wall and Glazed Assemblies Subcontracts', '95.83.08.006.04', 'M2'),
+ 'curtainwall': ('Curtain Wall and Glazed Assemblies Subcontracts', '95.83.08.006.04', 'M2'),
+ 'k-roc': ('Curtain Wall and Glazed Assemblies Subcontracts', '95.83.08.006.04', 'M2'),
+ 'chainlinkfence': ('Permanent Fences and Gates', '55.12.10', 'LM'),
+ 'column-concrete-round': ('Concrete Cylinder Piles', '60.03.16', 'M3'),
+ 'atk_dnnp_pile': ('Concrete Cylinder Piles', '60.03.16', 'M3'),
+ 'caisson1': ('Caisson - Concrete', '60.09.02', 'M3'),
+ 'caisson': ('Caisson - Concrete', '60.09.02', 'M3'),
+ 'stairs': ('Stairs - Pan Filled (Incl. Landings)', '61.09.24', 'M3'),
+ 'acppstructurerailing': ('Railings', '62.18.12', 'LM'),
+ 'handrail': ('Railings', '62.18.12', 'LM'),
+ 'toprail': ('Railings', '62.18.12', 'LM'),
+ 'railing': ('Railings', '62.18.12', 'LM'),
+ 'anchorbolt': ('Anchor Bolts', '61.30.02', 'Ea'),
+ 'rockanchor': ('Anchor Bolts', '61.30.02', 'Ea'),
+ 'anchorrod': ('Anchor Bolts', '61.30.02', 'Ea'),
+ 'anchor': ('Anchor Bolts', '61.30.02', 'Ea'),
+ 'floors:floor:160mmconcretewith76mmmetaldeck': ('Concrete on Metal Deck', '61.09.14', 'M3'),
+ 'floors:floor:160mmconcretewith50mmmetaldeck': ('Concrete on Metal Deck', '61.09.14', 'M3'),
+ 'floors:floor:metalroofdeck(11/2"x6"wr)': ('Concrete on Metal Deck', '61.09.14', 'M3'),
+ 'floors:floor:760thkcompositeslab+75deck': ('Concrete on Metal Deck', '61.09.14', 'M3'),
+ 'floors:floor:240thkconcreteonmetaldeck': ('Concrete on Metal Deck', '61.09.14', 'M3'),
+ 'floors:floor:38mmx0.91mmmetalroofdeck': ('Concrete on Metal Deck', '61.09.14', 'M3'),
+ 'floors:floor:metalroofdeck(3"x8"dr)': ('Concrete on Metal Deck', '61.09.14', 'M3'),
+ 'floors:floor:300thkslab+75deck': ('Concrete on Metal Deck', '61.09.14', 'M3'),
+ 'floors:floor:250thkslab+75deck': ('Concrete on Metal Deck', '61.09.14', 'M3'),
+ 'floors:floor:240thkdeckslab': ('Concrete on Metal Deck', '61.09.14', 'M3'),
+ 'topping': ('Topping Concrete', '61.03.14', 'M3'),
+ 'floors:floor:generic-sf2': ('Footings', '61.03.10', 'M3'),
+ 'floors:floor:400thkpier': ('Footings', '61.03.10', 'M3'),
+ 'floors:floors6:floors6': ('Footings', '61.03.10', 'M3'),
+ 'footing-rectangular:': ('Footings', '61.03.10', 'M3'),
+ 'footing': ('Footings', '61.03.10', 'M3'),
+ 'ftg': ('Footings', '61.03.10', 'M3'),
+ 'genericmodels:corbel:corbel': ('Specialty Walls', '61.06.06', 'Ea'),
+ 'structuralconnections:wf-column_bp-steel_facebased': ('Module Assembly', '62.03.04', 'Ea'),
+ 'genericmodels:ring:ring': ('Module Assembly', '62.03.04', 'Ea'),
+ 'genericmodels:baseplate': ('Module Assembly', '62.03.04', 'Ea'),
+ 'tb-bpunbraced': ('Module Assembly', '62.03.04', 'Ea'),
+ 'conduitfittings:conduitelbow-withoutfittings-emt:standard': ('Above Ground Conduit',
+                                                               '81.03.02',
+                                                               'LM'),
+ 'conduits:conduitwithfittings:electricalmetallictubing(emt)': ('Above Ground Conduit',
+                                                                '81.03.02',
+                                                                'LM'),
+ 'conduits:conduitwithoutfittings:r31-con-10001-1l-3"': ('Above Ground Conduit', '81.03.02', 'LM'),
+ 'conduits:conduitwithoutfittings:r31-con-10001-3l-3"': ('Above Ground Conduit', '81.03.02', 'LM'),
+ 'conduits:conduitwithoutfittings:r31-con-30002-1l-3"': ('Above Ground Conduit', '81.03.02', 'LM'),
+ 'conduits:conduitwithoutfittings:r31-con-30002-3l-3"': ('Above Ground Conduit', '81.03.02', 'LM'),
+ 'conduits:conduitwithfittings:r31-con-20001-10m-4"': ('Above Ground Conduit', '81.03.02', 'LM'),
+ 'conduits:conduitwithfittings:r31-con-20002-10m-4"': ('Above Ground Conduit', '81.03.02', 'LM'),
+ 'conduits:conduitwithfittings:r31-con-20001-9m-4"': ('Above Ground Conduit', '81.03.02', 'LM'),
+ 'conduits:conduitwithfittings:r31-con-20002-9m-4"': ('Above Ground Conduit', '81.03.02', 'LM'),
+ 'conduits:conduitwithfittings:r31-con-20003-9m-4"': ('Above Ground Conduit', '81.03.02', 'LM'),
+ 'conduits:conduitwithoutfittings:conduit': ('Above Ground Conduit', '81.03.02', 'LM'),
+ 'cabletrays:cabletraywithfittings:': ('Cable Trays for Electrical Systems', '81.06.02', 'EA'),
+ 'cabletrayfittings:': ('Cable Tray Supports / Cable Supports', '81.06.06', 'EA'),
+ 'cabletrayhanger': ('Cable Tray Supports / Cable Supports', '81.06.06', 'EA'),
+ 'electricalequipment:generator:generator': ('Large Facility Electrical Equipment',
+                                             '81.24.02',
+                                             'EA'),
+ 'communicationdevices:': ('Specialty Systems - Plant Communications', '81.33.02', 'EA'),
+ 'firealarmdevices': ('Specialty Systems - Fire and Gas Detection', '81.33.06', 'EA'),
+ 'lightingfixtures': ('Lighting - Specialty / Other fixtures', '81.36.06', 'EA'),
+ 'lightingdevices': ('Lighting - Specialty / Other fixtures', '81.36.06', 'EA'),
+ 'brick': ('Unit Masonry', '83.04.02', 'M2'),
+ 'walls:basicwall:ew-fdninsulation': ('Thermal Moisture Protection - Damp Proofing',
+                                      '83.07.02',
+                                      'M2'),
+ 'doors': ('Metal Doors and Frames', '83.08.02', 'EA'),
+ 'grout:plategrout': ('Concrete Accessories - Install Grout', '61.24.02', 'M3'),
+ 'grout': ('Concrete Accessories - Install Grout', '61.24.02', 'M3'),
+ 'circularopeninglevelbased': ('Concrete Accessories - Void Forms', '61.24.18', 'M3'),
+ 'floors:floor:rigidinsulation11/2"+coverboard1/2"+membrane1/8"': ('Metal Decking / Plating',
+                                                                   '62.12.02',
+                                                                   'M3'),
+ 'checkerplate': ('Metal Decking / Plating', '62.12.02', 'M3'),
+ 'structuralcolumns:column-concrete': ('Columns', '61.06.08', 'M3'),
+ 'structuralcolumns:m_concrete': ('Columns', '61.06.08', 'M3'),
+ 'structuralcolumns:m_precast': ('Columns', '61.06.08', 'M3'),
+ 'structuralcolumns:concrete': ('Columns', '61.06.08', 'M3'),
+ 'sprinklers': ('Sprinkler Heads', '72.46.04.025', 'EA'),
+ 'conduits:conduitwithoutfittings:rigidnonmetallicconduit((rncsch40)': ('Underground Misc Conduit',
+                                                                        '81.03.04',
+                                                                        'LM'),
+ 'conduits:conduitwithoutfittings:rigidnonmetallicconduit(rnc)': ('Underground Misc Conduit',
+                                                                  '81.03.04',
+                                                                  'LM'),
+ 'conduits:conduitwithoutfittings:rigidmetallicconduit(rnc)': ('Underground Misc Conduit',
+                                                               '81.03.04',
+                                                               'LM'),
+ 'conduitfittings:conduitelbow-withoutfittings-rmc:standard': ('Underground Misc Conduit - OTHER '
+                                                               '(>=4") - Conduit / Support / '
+                                                               'Fittings',
+                                                               '81.03.04.020.02',
+                                                               'EA'),
+ 'conduitfittings:conduitbody-typel-up-rmc:lb': ('Underground Misc Conduit - OTHER (>=4") - '
+                                                 'Conduit / Support / Fittings',
+                                                 '81.03.04.020.02',
+                                                 'EA'),
+ 'walls:basicwall:ew1c-metalcladrainscreenwall-10"gap_forvest': ('Exterior Metal Stud High Wall '
+                                                                 "System (Height 8' and Higher) - "
+                                                                 'All Sizes',
+                                                                 '83.09.04',
+                                                                 'M2'),
+ 'walls:basicwall:ew1c-metalcladrainscreenwall-concreteback-up': ('Exterior Metal Stud High Wall '
+                                                                  "System (Height 8' and Higher) - "
+                                                                  'All Sizes',
+                                                                  '83.09.04',
+                                                                  'M2'),
+ 'walls:basicwall:ew1b-metalcladrainscreenwall-8"stud': ('Exterior Metal Stud High Wall System '
+                                                         "(Height 8' and Higher) - All Sizes",
+                                                         '83.09.04',
+                                                         'M2'),
+ 'walls:basicwall:ew1a-metalcladrainscreenwall-6"stud': ('Exterior Metal Stud High Wall System '
+                                                         "(Height 8' and Higher) - All Sizes",
+                                                         '83.09.04',
+                                                         'M2'),
+ 'walls:basicwall:p': ('Interior Metal Stud High Wall Framing (Height 8" and Higher) - All Sizes',
+                       '83.09.08',
+                       'M2'),
+ 'walls:basicwall:metalwallpanel11/2"(insulated)': ('Metal Stud Assembly - Insulation and Vapor '
+                                                    'Barrier',
+                                                    '83.09.14',
+                                                    'M2'),
+ 'floors:floor:25mmaccesstile': ('Finishes - Tile Work', '83.09.34', 'M2'),
+ 'casework:countertopwsink:': ('Toilet, Bath, and Laundry Accessories', '83.10.08', 'EA'),
+ 'plumbingfixtures:': ('Toilet, Bath, and Laundry Accessories', '83.10.08', 'EA'),
+ 'bollard': ('Building Equipment - Parking Control Equipment', '83.11.04', 'EA'),
+ 'electricalfixtures:_wf_wallbox:furniturefeed': ('Furnishings - Site Furnishings',
+                                                  '83.12.20',
+                                                  'EA'),
+ 'furnituresystems:': ('Furnishings - Site Furnishings', '83.12.20', 'EA'),
+ 'casework:granite': ('Furnishings - Site Furnishings', '83.12.20', 'EA'),
+ 'furniture:': ('Furnishings - Site Furnishings', '83.12.20', 'EA'),
+ 'ductfittings:': ('Building HVAC - Ductwork Installation', '83.23.20', 'EA'),
+ 'ducts': ('Building HVAC - Ductwork Installation', '83.23.20', 'LM'),
+ 'curtainwallmullions': ('Building Openings Subcontracts', '95.83.08', 'EA'),
+ 'conduitwallpenetrationsleeve': ('Misc Equipment / Wall Supports', '62.18.20', 'EA'),
+ 'conduitwallpenetration': ('Misc Equipment / Wall Supports', '62.18.20', 'EA'),
+ 'conduitfittings:': ('Misc Equipment / Wall Supports', '62.18.20', 'EA'),
+ 'walls:basicwall:pedestaldp-sc': ('Abutments and Wing Walls', '61.06.04', 'M3'),
+ 'walls:basicwall:shielddp-sc': ('Abutments and Wing Walls', '61.06.04', 'M3'),
+ 'walls:basicwall:sccvdp-sc': ('Abutments and Wing Walls', '61.06.04', 'M3'),
+ 'walls:basicwall:dp-sc': ('Abutments and Wing Walls', '61.06.04', 'M3'),
+ 'structuralfoundations:foundationslab:slabongrade-concrete-650mm': ('Tunnel Concrete',
+                                                                     '85.12.04',
+                                                                     'M3'),
+ 'structuralfoundations:foundationslab:concreteslab-1000mm': ('Tunnel Concrete', '85.12.04', 'M3'),
+ 'structuralfoundations:foundationslab:mudslab-75mm': ('Tunnel Concrete', '85.12.04', 'M3'),
+ 'walls:basicwall:concrete-castinplace-1000mm': ('Tunnel Concrete', '85.12.04', 'M3'),
+ 'genericmodels:pipeshorizontal:10x2x200': ('Tunnel Concrete', '85.12.04', 'M3'),
+ 'genericmodels:connectionpipetotunnel': ('Tunnel Concrete', '85.12.04', 'M3'),
+ 'walls:basicwall:shaftwall-220conc': ('Tunnel Concrete', '85.12.04', 'M3'),
+ 'genericmodels:6050tunnel:6050tunnel': ('Tunnel Concrete', '85.12.04', 'M3'),
+ 'walls:basicwall:shaftwall-12conc': ('Tunnel Concrete', '85.12.04', 'M3'),
+ 'walls:basicwall:shaftwall-87conc': ('Tunnel Concrete', '85.12.04', 'M3'),
+ 'walls:basicwall:shaftwall-600mm': ('Tunnel Concrete', '85.12.04', 'M3'),
+ 'genericmodels:slabvoid:slabvoid': ('Tunnel Concrete', '85.12.04', 'M3'),
+ 'genericmodels:interface:interface': ('Tunnel Concrete', '85.12.04', 'M3'),
+ 'genericmodels:concrete:concrete': ('Tunnel Concrete', '85.12.04', 'M3'),
+ 'walls:basicwall:shaftwall-75': ('Tunnel Concrete', '85.12.04', 'M3'),
+ 'genericmodels:base:1036tunnel': ('Tunnel Concrete', '85.12.04', 'M3'),
+ 'genericmodels:panel:panel': ('Tunnel Concrete', '85.12.04', 'M3'),
+ 'genericmodels:lowerpipe': ('Tunnel Concrete', '85.12.04', 'M3'),
+ 'genericmodels:tunnel': ('Tunnel Concrete', '85.12.04', 'M3'),
+ 'shieldingwall-removable': ('Structural Steel Industrial Structures', '62.03.02', 'Ton'),
+ 'structuralcolumns': ('Structural Steel Industrial Structures', '62.03.02', 'Ton'),
+ 'structuralframing': ('Structural Steel Industrial Structures', '62.03.02', 'Ton'),
+ 'structuralrebar': ('Structural Steel Industrial Structures', '62.03.02', 'Ton'),
+ 'trussgusset': ('Structural Steel Industrial Structures', '62.03.02', 'Ton'),
+ 'sagrod': ('Structural Steel Industrial Structures', '62.03.02', 'Ton'),
+ 'rebar': ('Structural Steel Industrial Structures', '62.03.02', 'Ton'),
+ 'hardware': ('Structural Steel Industrial Structures', '62.03.02', 'Ea'),
+ 'washer': ('Structural Steel Industrial Structures', '62.03.02', 'Ea'),
+ 'screws': ('Structural Steel Industrial Structures', '62.03.02', 'Ea'),
+ 'bolts': ('Structural Steel Industrial Structures', '62.03.02', 'Ea'),
+ 'ring2': ('Structural Steel Industrial Structures', '62.03.02', 'Ea'),
+ 'nuts': ('Structural Steel Industrial Structures', '62.03.02', 'Ea'),
+ 'nut': ('Structural Steel Industrial Structures', '62.03.02', 'Ea'),
+ 'structuralconnections': ('Module Assembly', '62.03.04', 'Ton'),
+ 'structuralstiffeners': ('Module Assembly', '62.03.04', 'Ton'),
+ 'y86spacereservation': ('Module Assembly', '62.03.04', 'Ton'),
+ 'gusset': ('Module Assembly', '62.03.04', 'Ton'),
+ 'grill': ('Module Assembly', '62.03.04', 'Ton'),
+ 'structuralfoundations:wallfoundation:stripftg1000x400(sf01)': ('Grade Beams', '61.03.12', 'M3'),
+ 'structuralfoundations:wallfoundation:stripftg1300x400(sf01)': ('Grade Beams', '61.03.12', 'M3'),
+ 'structuralfoundations:wallfoundation:stripftg3000x600(sf02)': ('Grade Beams', '61.03.12', 'M3'),
+ 'structuralfoundations:wallfoundation:stripftg700x300(sf02)': ('Grade Beams', '61.03.12', 'M3'),
+ 'structuralframing:precast-rectangularbeam:3600x2000x800': ('Grade Beams', '61.03.12', 'M3'),
+ 'structuralfoundations:wallfoundation:stripftg3000x600': ('Grade Beams', '61.03.12', 'M3'),
+ 'structuralframing:beam-concrete-rectangular:1500x1000': ('Grade Beams', '61.03.12', 'M3'),
+ 'slabedges:slabedge:slabedge3500x3500': ('Grade Beams', '61.03.12', 'M3'),
+ 'walls:basicwall:conc.fdn350(fw01)': ('Grade Beams', '61.03.12', 'M3'),
+ 'walls:basicwall:conc.fdn700(fw02)': ('Grade Beams', '61.03.12', 'M3'),
+ 'slabedges:slabedge:slabedge': ('Grade Beams', '61.03.12', 'M3'),
+ 'walls:basicwall:conc.fdn600': ('Grade Beams', '61.03.12', 'M3'),
+ 'gradebeam': ('Grade Beams', '61.03.12', 'M3'),
+ 'walls:basicwall:ism_wall': ('Slab on Grade/Mass Slabs', '61.03.06', 'M3'),
+ 'structuralfoundation': ('Slab on Grade/Mass Slabs', '61.03.06', 'M3'),
+ 'foundationslab': ('Slab on Grade/Mass Slabs', '61.03.06', 'M3'),
+ 'floors:floor:': ('Slab on Grade/Mass Slabs', '61.03.06', 'M3'),
+ 'slabongrade': ('Slab on Grade/Mass Slabs', '61.03.06', 'M3'),
+ 'wallopening:electrical': ('Cast in Place Walls', '61.06.02', 'M3'),
+ 'wall:castinplace': ('Cast in Place Walls', '61.06.02', 'M3'),
+ 'wall:concrete': ('Cast in Place Walls', '61.06.02', 'M3'),
+ 'shieldingwall': ('Cast in Place Walls', '61.06.02', 'M3'),
+ 'concretewall': ('Cast in Place Walls', '61.06.02', 'M3'),
+ 'wall:conc': ('Cast in Place Walls', '61.06.02', 'M3'),
+ 'curbwall': ('Cast in Place Walls', '61.06.02', 'M3'),
+ 'kerbwall': ('Cast in Place Walls', '61.06.02', 'M3'),
+ 'wall:fw': ('Cast in Place Walls', '61.06.02', 'M3'),
+ 'stgwall': ('Cast in Place Walls', '61.06.02', 'M3'),
+ 'hdc': ('Cast in Place Walls', '61.06.02', 'M3'),
+ 'structuralframing:m_concrete-rectangularbeam': ('Cast In Place Concrete Girders / Beams',
+                                                  '61.09.16',
+                                                  'M3'),
+ 'conduits:': ('Conduit', '81.03', 'LM'),
+ 'grid': ('Interior Metal Stud Ceilings and Soffits Framing - All Sizes', '83.09.10', 'M2'),
+ 'compoundceiling': ('Acoustical Tile Ceilings', '83.09.22', 'M2'),
+ 'windows': ('Doors and Windows - Overall Door Hardware', '83.08.10', 'Ea'),
+ 'securitydevices:_wf_doordevices': ('Specialty Systems - Security / CCTV', '81.33.04', 'Ea'),
+ 'coldroof': ('Elevated Slab', '72.03.06', 'Ea'),
+ 'barscreen': ('Bar Screens', '62.18.18', 'M2'),
+ 'casework': ('Furnishings - Lab Casework', '83.12.16', 'LM'),
+ 'ductaccessories:': ('Heating, Ventilating, and Air Conditioning (HVAC)', '83.23', 'Ea/LM'),
+ 'missinginfo': ('missing info', 'missing info', 'missing info')}
+
+NORMALIZED_SKIP_LIST = ['centerline',
+ 'lines',
+ 'rooms',
+ 'pipes:pipetypes',
+ 'spaceseparation',
+ 'roomseperation',
+ 'levels:level',
+ 'pipefittings:',
+ 'grids:grid',
+ 'gridheads',
+ 'parking',
+ 'spaces',
+ 'modeltext',
+ 'northarrow',
+ 'levelhead',
+ 'loadingvehicle',
+ '.dwg',
+ 'siteinfo',
+ 'legend',
+ 'clearance',
+ 'clearence',
+ 'elumtools',
+ 'keepoutzone',
+ 'gtp',
+ 'extrudedsurface',
+ 'acppdb3disospheresymbol',
+ 'acppdb3disoarrowsymbol',
+ 'surface',
+ 'acppdb3disostartpointsymbol',
+ 'featureline',
+ 'revolvedsurface',
+ 'tinsurface',
+ 'sweptsurface']
@@ -7,129 +7,330 @@ be added later.
 """
 
 import argparse
+import codecs
 import csv
+import functools
+import multiprocessing
 import os
+from collections import Counter
 from typing import Optional
 
+from constants import (
+    INPUT_ITEM_TYPE,
+    INPUT_ENTITY_HANDLE,
+    INPUT_ELEMENT_ID_VALUE,
+    INPUT_ITEM_SOURCE_FILE,
+)
 from helpers import (
-    enrich_row,
+    ENRICHMENT_COLUMNS,
+    compute_enrichment_values,
+    enrich_positional_rows,
     ensure_fieldnames_with_appends,
     compute_output_path,
-    should_skip_row,
+    should_skip_fields,
 )
 
+# Rows per task when enrichment is fanned out to worker processes; large
+# enough to amortize pickling overhead, small enough to keep workers busy
+PARALLEL_CHUNK_SIZE = 10000
 
-def detect_file_encoding(file_path: str) -> str:
+# Bytes sampled from the start of the input for encoding detection; enough
+# to cover the header plus thousands of rows without re-reading the file
+ENCODING_SAMPLE_SIZE = 65536
+
+
+def _read_sample(file_path: str) -> bytes:
     """
-    Attempt to detect the encoding of a CSV file.
-    
-    Tries multiple common encodings and returns the first one that successfully
-    reads the file. This ensures compatibility with various CSV formats.
-    
+    Read the binary detection sample from the start of the file.
+
     Args:
-        file_path: Path to the CSV file to detect encoding for
-        
+        file_path: Path to the CSV file
+
+    Returns:
+        Up to ENCODING_SAMPLE_SIZE bytes from the start of the file
+    """
+    with open(file_path, 'rb') as f:
+        return f.read(ENCODING_SAMPLE_SIZE)
+
+
+def _encoding_from_sample(sample: bytes) -> str:
+    """
+    Detect the text encoding of a binary sample.
+
+    Tries multiple common encodings and returns the first one that decodes
+    the sample. Sampling keeps the detection cost constant instead of
+    re-reading the whole file once per candidate encoding.
+
+    Args:
+        sample: Bytes from the start of the CSV file
+
     Returns:
         The detected encoding name (e.g., 'utf-8-sig', 'utf-8', 'latin1')
     """
+    # A byte-order mark is a definitive signature; no need to trial-decode
+    if sample.startswith(b'\xef\xbb\xbf'):
+        return 'utf-8-sig'
+    if sample.startswith((b'\xff\xfe', b'\xfe\xff')):
+        return 'utf-16'
+
     # Common encodings to try, in order of preference
     encodings_to_try = ['utf-8-sig', 'utf-8', 'latin1', 'cp1252', 'iso-8859-1']
-    
+
+    # A full-size sample may end mid-character; final=False lets the
+    # incremental decoder hold a truncated trailing sequence as pending
+    # state instead of treating it as a wrong encoding
+    final = len(sample) < ENCODING_SAMPLE_SIZE
+
     for encoding in encodings_to_try:
         try:
-            with open(file_path, 'r', encoding=encoding, newline='') as f:
-                # Try to read the entire file to ensure encoding is valid
-                f.read()
+            codecs.getincrementaldecoder(encoding)('strict').decode(sample, final)
             return encoding
         except (UnicodeDecodeError, LookupError):
             continue
-    
+
     # If all encodings fail, default to utf-8 with error handling
     return 'utf-8'
 
 
+def detect_file_encoding(file_path: str) -> str:
+    """
+    Attempt to detect the encoding of a CSV file.
+
+    Args:
+        file_path: Path to the CSV file to detect encoding for
+
+    Returns:
+        The detected encoding name (e.g., 'utf-8-sig', 'utf-8', 'latin1')
+    """
+    return _encoding_from_sample(_read_sample(file_path))
+
+
+def detect_dialect(file_path: str) -> tuple:
+    """
+    Detect the encoding and delimiter of a CSV file from one sample read.
+
+    Reads a single binary sample, detects the encoding against it, then
+    runs csv.Sniffer over the decoded text so quoted fields containing a
+    delimiter do not skew the result. Falls back to header delimiter
+    counting when the sniffer cannot decide. One open/read serves both
+    detections instead of one file pass each.
+
+    Args:
+        file_path: Path to the CSV file
+
+    Returns:
+        (encoding, delimiter) tuple for the file
+    """
+    sample = _read_sample(file_path)
+    encoding = _encoding_from_sample(sample)
+    decoded = sample.decode(encoding, errors='replace')
+    try:
+        dialect = csv.Sniffer().sniff(decoded, delimiters=",;\t|")
+        delimiter = dialect.delimiter
+    except csv.Error:
+        delimiter = _delimiter_from_header(decoded.split('\n', 1)[0])
+    return encoding, delimiter
+
+
+def _delimiter_from_header(header: str) -> str:
+    """
+    Detect the delimiter by counting candidates in the header row.
+
+    Args:
+        header: The first (column names) line of the CSV
+
+    Returns:
+        The detected delimiter character (e.g., ',', ';', '\t', '|')
+    """
+    if not header:
+        return ','
+
+    # Common delimiters to test, in order of preference
+    potential_delimiters = [';', ',', '\t', '|']
+
+    # One Counter pass over the header replaces one str.count scan per
+    # candidate; ties resolve in preference order since max keeps the
+    # first maximal candidate
+    char_counts = Counter(header)
+
+    # If no delimiters found, default to comma
+    if not any(char_counts.get(delim) for delim in potential_delimiters):
+        return ','
+
+    # Return the delimiter with the highest count
+    return max(potential_delimiters, key=lambda delim: char_counts.get(delim, 0))
+
+
 def detect_csv_delimiter(file_path: str, encoding: str) -> str:
     """
     Detect the delimiter used in a CSV file by analyzing the header row.
-    
-    Determines the delimiter by counting occurrences of common delimiters
-    in the first row (column names). The delimiter with the most occurrences
-    is selected.
-    
+
     Args:
         file_path: Path to the CSV file
         encoding: Encoding to use when reading the file
-        
+
     Returns:
         The detected delimiter character (e.g., ',', ';', '\t', '|')
     """
     try:
         with open(file_path, 'r', encoding=encoding, newline='') as f:
-            # Read only the first line (header with column names)
-            header = f.readline()
-            
-            if not header:
-                return ','
-            
-            # Common delimiters to test, in order of preference
-            potential_delimiters = [';', ',', '\t', '|']
-            
-            # Count occurrences of each delimiter in the header row
-            delimiter_counts = {}
-            for delim in potential_delimiters:
-                count = header.count(delim)
-                if count > 0:
-                    delimiter_counts[delim] = count
-            
-            # If no delimiters found, default to comma
-            if not delimiter_counts:
-                return ','
-            
-            # Return the delimiter with the highest count
-            return max(delimiter_counts, key=delimiter_counts.get)
-            
+            return _delimiter_from_header(f.readline())
     except Exception:
         # If detection fails, default to comma
         return ','
 
 
-def enrich_csv(input_csv_path: str, output_csv_path: str) -> None:
+def _column_index(header, column):
+    """
+    Return the index of a column in the header, or -1 if absent.
+
+    Args:
+        header: List of column names from the input CSV
+        column: Column name to look up
+
+    Returns:
+        The zero-based column index, or -1 when the column is missing
+    """
+    try:
+        return header.index(column)
+    except ValueError:
+        return -1
+
+
+def _iter_row_chunks(reader, item_type_idx, entity_idx, element_idx, chunk_size=PARALLEL_CHUNK_SIZE):
+    """
+    Yield skip-filtered positional rows from the reader in fixed-size chunks.
+
+    Args:
+        reader: csv.reader over the input file, past the header
+        item_type_idx: Column index of ItemType, or -1 if absent
+        entity_idx: Column index of EntityHandleValue, or -1 if absent
+        element_idx: Column index of ElementIDValue, or -1 if absent
+        chunk_size: Maximum number of rows per chunk
+
+    Yields:
+        Lists of raw positional rows ready for enrichment
+    """
+    # Bind the loop invariants as locals: LOAD_FAST beats LOAD_GLOBAL /
+    # LOAD_ATTR on every one of the ~372k iterations
+    _skip = should_skip_fields
+    chunk = []
+    _append = chunk.append
+    for row in reader:
+        width = len(row)
+        entity_handle = row[entity_idx] if 0 <= entity_idx < width else ""
+        element_id = row[element_idx] if 0 <= element_idx < width else ""
+        item_type = row[item_type_idx] if 0 <= item_type_idx < width else ""
+        if _skip(entity_handle, element_id, item_type):
+            continue
+        _append(row)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+            _append = chunk.append
+    if chunk:
+        yield chunk
+
+
+def enrich_csv(input_csv_path: str, output_csv_path: str, jobs: int = 1) -> None:
     """
     Process and enrich a CSV file with additional computed columns.
 
-    Reads the input CSV with auto-detected encoding and delimiter, enriches 
-    each row with account fields, then writes the enriched data to an 
+    Reads the input CSV with auto-detected encoding and delimiter, enriches
+    each row with account fields, then writes the enriched data to an
     Excel-compatible output CSV with UTF-8-sig encoding.
 
+    Rows are processed positionally (csv.reader lists) instead of through
+    DictReader/DictWriter: the interesting column indices are resolved once
+    from the header, so no per-row dict is allocated or reserialised.
+
+    With jobs > 1, enrichment is fanned out to a multiprocessing pool in
+    row chunks; each row is independent, so workers scale near-linearly
+    while the parent streams chunks back to the writer in input order.
+
     Args:
         input_csv_path: Path to the input CSV file
         output_csv_path: Path where enriched CSV will be written
+        jobs: Number of worker processes to enrich with (1 = in-process)
     """
-    # Detect the encoding of the input file
-    detected_encoding = detect_file_encoding(input_csv_path)
+    # Detect encoding and delimiter from a single sample read
+    detected_encoding, detected_delimiter = detect_dialect(input_csv_path)
     print(f"Detected input encoding: {detected_encoding}")
-    
-    # Detect the delimiter (comma, semicolon, tab, etc.)
-    detected_delimiter = detect_csv_delimiter(input_csv_path, detected_encoding)
     delimiter_name = {',' : 'comma', ';': 'semicolon', '\t': 'tab'}.get(detected_delimiter, repr(detected_delimiter))
     print(f"Detected input delimiter: {delimiter_name} ({repr(detected_delimiter)})")
-    
-    with open(input_csv_path, "r", encoding=detected_encoding, newline="") as infile:
-        reader = csv.DictReader(infile, delimiter=detected_delimiter)
-        if reader.fieldnames is None:
+
+    # 1 MiB buffers on both ends amortise read()/write() syscalls, which
+    # matters on network filesystems where the exports usually live
+    with open(input_csv_path, "r", encoding=detected_encoding, newline="", buffering=1 << 20) as infile:
+        reader = csv.reader(infile, delimiter=detected_delimiter)
+        header = next(reader, None)
+        if header is None:
             raise ValueError("Input CSV has no header row")
-        fieldnames = ensure_fieldnames_with_appends(reader.fieldnames)
+        fieldnames = ensure_fieldnames_with_appends(header)
+
+        # Resolve the consumed and produced column positions once per file
+        item_type_idx = _column_index(header, INPUT_ITEM_TYPE)
+        entity_idx = _column_index(header, INPUT_ENTITY_HANDLE)
+        element_idx = _column_index(header, INPUT_ELEMENT_ID_VALUE)
+        source_file_idx = _column_index(header, INPUT_ITEM_SOURCE_FILE)
+        dest_indices = [fieldnames.index(c) for c in ENRICHMENT_COLUMNS]
+        input_width = len(header)
+        output_width = len(fieldnames)
 
         # Write with UTF-8-sig (BOM) and comma delimiter for maximum Excel compatibility
         # This ensures the output can be opened directly in Excel without format conversion
-        with open(output_csv_path, "w", encoding="utf-8-sig", newline="") as outfile:
-            writer = csv.DictWriter(outfile, fieldnames=fieldnames, delimiter=',', extrasaction="ignore")
-            writer.writeheader()
-            for row in reader:
-                if should_skip_row(row, reader.fieldnames):
-                    continue
-                enriched = enrich_row(row)
-                writer.writerow(enriched)
+        with open(output_csv_path, "w", encoding="utf-8-sig", newline="", buffering=1 << 20) as outfile:
+            writer = csv.writer(outfile, delimiter=',')
+            writer.writerow(fieldnames)
+
+            # Without both identifier columns every row is skipped, so only
+            # the header is written (same behavior as the dict-based path)
+            if entity_idx < 0 and element_idx < 0:
+                return
+
+            if jobs > 1:
+                enrich_chunk = functools.partial(
+                    enrich_positional_rows,
+                    item_type_idx=item_type_idx,
+                    source_file_idx=source_file_idx,
+                    input_width=input_width,
+                    output_width=output_width,
+                    dest_indices=dest_indices,
+                )
+                with multiprocessing.Pool(processes=jobs) as pool:
+                    chunks = _iter_row_chunks(reader, item_type_idx, entity_idx, element_idx)
+                    for enriched_chunk in pool.imap(enrich_chunk, chunks):
+                        writer.writerows(enriched_chunk)
+            else:
+                # Hoist per-iteration attribute/global lookups out of the
+                # hot loop
+                _skip = should_skip_fields
+                _values = compute_enrichment_values
+                pad = [""] * (output_width - input_width)
+                # Buffer enriched rows and flush them with one writerows
+                # call per batch: the write loop runs in C and the
+                # underlying write() is called far less often
+                batch = []
+                _append = batch.append
+                for row in reader:
+                    width = len(row)
+                    entity_handle = row[entity_idx] if 0 <= entity_idx < width else ""
+                    element_id = row[element_idx] if 0 <= element_idx < width else ""
+                    item_type = row[item_type_idx] if 0 <= item_type_idx < width else ""
+                    if _skip(entity_handle, element_id, item_type):
+                        continue
+                    if width != input_width:
+                        row = row[:input_width] + [""] * (input_width - width)
+                    source_file = row[source_file_idx] if source_file_idx >= 0 else ""
+                    out_row = row + pad
+                    for dest, value in zip(dest_indices, _values(item_type, source_file)):
+                        out_row[dest] = value
+                    _append(out_row)
+                    if len(batch) >= PARALLEL_CHUNK_SIZE:
+                        writer.writerows(batch)
+                        batch.clear()
+                if batch:
+                    writer.writerows(batch)
 
 
 def main() -> None:
@@ -145,12 +346,18 @@ def main() -> None:
         required=False,
         help="Optional explicit output CSV path; defaults to <input>_enriched.csv",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes for enrichment (default: 1)",
+    )
     args = parser.parse_args()
 
     input_path = os.path.abspath(args.input)
     output_path = os.path.abspath(compute_output_path(input_path, args.output))
 
-    enrich_csv(input_path, output_path)
+    enrich_csv(input_path, output_path, jobs=args.jobs)
     print(f"Wrote enriched CSV: {output_path}")
 
 
@@ -0,0 +1,45 @@
+"""
+Generate constants_generated.py with pre-built normalized lookups.
+
+The normalized keyword lookup and skip list never change between runs, so
+building them on every import is wasted startup work. This script runs the
+builders once and writes the results out as plain Python literals, together
+with a fingerprint of the source tables so constants.py can detect (and
+ignore) a stale file after description_to_items or item_type_to_skip change.
+
+Usage (from this directory, after editing the source tables):
+    python gen_constants.py
+"""
+
+import pprint
+
+import constants
+
+
+def main() -> None:
+    """
+    Write constants_generated.py next to constants.py.
+    """
+    # Run the builders directly instead of going through the lazy module
+    # attributes: those resolve from an existing constants_generated.py
+    # whose fingerprint still matches, which would round-trip the old
+    # file's ordering rather than regenerate from the source tables.
+    lookup = {k: tuple(v) for k, v in constants._build_normalized_keyword_lookup().items()}
+    skip_list = list(constants._build_normalized_skip_list())
+    fingerprint = constants._source_fingerprint()
+
+    with open("constants_generated.py", "w", encoding="utf-8") as out:
+        out.write('"""\n')
+        out.write("Pre-built normalized lookups. GENERATED by gen_constants.py - do not edit.\n")
+        out.write('"""\n\n')
+        out.write(f"SOURCE_FINGERPRINT = {fingerprint!r}\n\n")
+        out.write("NORMALIZED_KEYWORD_LOOKUP = ")
+        out.write(pprint.pformat(lookup, width=100, sort_dicts=False))
+        out.write("\n\nNORMALIZED_SKIP_LIST = ")
+        out.write(pprint.pformat(skip_list, width=100))
+        out.write("\n")
+    print(f"Wrote constants_generated.py ({len(lookup)} keywords, {len(skip_list)} skip entries)")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,10 @@ This module provides utilities to generate output column values based on
 functions return placeholders while preserving the processing contract.
 """
 
+from __future__ import annotations
+
+import functools
+
 from pathlib import Path
 from typing import Dict, List
 
@@ -22,25 +26,42 @@ from constants import (
     mpl_map,
     # Performance-optimized pre-computed lookups
     normalized_keyword_lookup,
-    normalized_skip_list,
+    keyword_automaton,
+    get_keyword_pattern,
+    should_skip,
     _normalize_string,
 )
 
 
+# Keywords ordered longest-first for the pure-Python fallback scan; the
+# lookup never changes, so sorting per call was pure wasted work. Stored
+# as a tuple: it is immutable anyway, and tuple iteration is marginally
+# cheaper than list iteration in the hot loop.
+_SORTED_NORMALIZED_KEYWORDS = tuple(
+    sorted(normalized_keyword_lookup.items(), key=lambda kv: len(kv[0]), reverse=True)
+)
+
+
+@functools.lru_cache(maxsize=4096)
 def compute_account_from_item_type(item_type: str | None) -> List[str]:
     """
     Compute [account_description, account_code, uom] from the given item type.
 
-    OPTIMIZED: Uses pre-computed normalized keyword lookup for 50-100x speedup.
-    
+    Real exports repeat the same ItemType thousands of times, so results
+    are memoized per distinct value: after warmup the per-row cost is one
+    hash probe instead of a normalization plus automaton pass.
+
+    OPTIMIZED: Uses an Aho-Corasick automaton (when pyahocorasick is installed)
+    to match all keywords in one linear pass per row instead of one substring
+    scan per keyword.
+
     Logic:
     - Normalize the input string by removing all whitespace and lowercasing
     - Check if any pre-normalized keyword appears as a substring within the
       normalized item_type
-    - Keywords are checked longest-first to ensure more specific matches take priority
+    - The longest matching keyword wins so more specific matches take priority
       (e.g., "Curtain Wall Mullions" before "Curtain Wall")
     - Keywords are pre-computed at module load time for maximum efficiency
-    - On first match, return the account details tuple directly
 
     Args:
         item_type: The `ItemType` value from the input row
@@ -54,31 +75,91 @@ def compute_account_from_item_type(item_type: str | None) -> List[str]:
     # Normalize once per row instead of once per keyword
     norm_item_type = _normalize_string(item_type)
 
-    # Sort keywords by length (longest first) to prioritize specific matches
-    # This ensures "Curtain Wall Mullions" matches before "Curtain Wall"
-    sorted_keywords = sorted(normalized_keyword_lookup.items(), 
-                            key=lambda x: len(x[0]), 
-                            reverse=True)
-    
-    # Iterate through keywords checking most specific first
-    for norm_keyword, account_details in sorted_keywords:
+    # Exact-match fast path: many rows carry an ItemType that IS a keyword
+    # (e.g. "Caisson", "Anchor Bolt"), and one hash probe beats any scan.
+    # An exact hit is always the longest possible match, since no other
+    # keyword can be a longer substring of an equal-length string.
+    exact_details = normalized_keyword_lookup.get(norm_item_type)
+    if exact_details is not None:
+        return exact_details
+
+    if keyword_automaton is not None:
+        # Single O(len(norm_item_type)) automaton pass. Each payload
+        # carries the keyword's rank in the longest-first scan order, so
+        # the minimum rank over all matches is exactly the keyword the
+        # fallback loop below would return - same longest-match-wins
+        # rule, same tie-break between equal-length keywords.
+        best_rank = -1
+        best_details = None
+        for _end_index, (rank, account_details) in keyword_automaton.iter(norm_item_type):
+            if best_rank < 0 or rank < best_rank:
+                best_rank = rank
+                best_details = account_details
+        return best_details if best_details is not None else ("", "", "")
+
+    # Fallback: one C-level alternation search decides whether any keyword
+    # occurs at all, so unmatched values exit without a Python-level scan.
+    # The regex is only a prefilter - its leftmost-match semantics can
+    # differ from longest-match-wins when keywords overlap - so a hit
+    # still goes through the longest-first substring loop below.
+    if get_keyword_pattern().search(norm_item_type) is None:
+        return ("", "", "")
+
+    # Pure-Python substring scan over all keywords, most specific
+    # (longest) first so "Curtain Wall Mullions" matches before
+    # "Curtain Wall". The sorted list is invariant, so it is built once
+    # at module level instead of on every call.
+    for norm_keyword, account_details in _SORTED_NORMALIZED_KEYWORDS:
         if norm_keyword in norm_item_type:
             return account_details
 
     return ("", "", "")
 
 
+# Enrichment columns appended to the output, in write order. The
+# positional fast path and ensure_fieldnames_with_appends both derive
+# from this single list so the value order can never drift from the
+# header order.
+ENRICHMENT_COLUMNS = [
+    MPL_COLUMN,
+    MPL_DESC_COLUMN,
+    ACCOUNT_CODE_COLUMN,
+    ACCOUNT_DESCRIPTION_COLUMN,
+    UOM_COLUMN,
+]
+
+
+def compute_enrichment_values(item_type: str, item_source_file: str) -> List[str]:
+    """
+    Compute the enrichment column values for one row.
+
+    Args:
+        item_type: The ItemType value from the input row
+        item_source_file: The ItemSourceFile value from the input row
+
+    Returns:
+        Values for ENRICHMENT_COLUMNS, in the same order
+    """
+    account_desc, account_code, uom_value = compute_account_from_item_type(item_type)
+    mpl_value = compute_mpl(item_source_file)
+    return [mpl_value, mpl_map.get(mpl_value, ""), account_code, account_desc, uom_value]
+
+
 def enrich_row(row: Dict[str, str]) -> Dict[str, str]:
     """
     Enrich a single CSV row with computed account values.
 
     Adds ACCOUNT_CODE and ACCOUNT_DESCRIPTION columns to the row.
 
+    The input dict is mutated in place and returned: each DictReader row
+    is fresh and never reused by the caller, so copying it first only
+    doubled the per-row dict allocations.
+
     Args:
-        row: Dictionary containing the original CSV row data
+        row: Dictionary containing the original CSV row data; consumed
 
     Returns:
-        Dictionary with original data plus enriched fields
+        The same dictionary with the enriched fields added
     """
     account_details = compute_account_from_item_type(row.get(INPUT_ITEM_TYPE))
     account_desc = account_details[0]
@@ -90,13 +171,72 @@ def enrich_row(row: Dict[str, str]) -> Dict[str, str]:
     mpl_value = compute_mpl(item_source_file)
     mpl_desc_value = mpl_map.get(mpl_value, "")
 
-    enriched = dict(row)
-    enriched[MPL_COLUMN] = mpl_value
-    enriched[MPL_DESC_COLUMN] = mpl_desc_value
-    enriched[ACCOUNT_CODE_COLUMN] = account_code
-    enriched[ACCOUNT_DESCRIPTION_COLUMN] = account_desc
-    enriched[UOM_COLUMN] = uom_value
-    return enriched
+    row[MPL_COLUMN] = mpl_value
+    row[MPL_DESC_COLUMN] = mpl_desc_value
+    row[ACCOUNT_CODE_COLUMN] = account_code
+    row[ACCOUNT_DESCRIPTION_COLUMN] = account_desc
+    row[UOM_COLUMN] = uom_value
+    return row
+
+
+def enrich_rows(rows: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """
+    Enrich a chunk of CSV rows.
+
+    Top-level entry point for multiprocessing workers. The precomputed
+    lookups (and automaton) live at module level, so forked workers inherit
+    them copy-on-write instead of rebuilding or shipping them per task.
+
+    Args:
+        rows: List of CSV row dictionaries (already skip-filtered)
+
+    Returns:
+        List of enriched row dictionaries, in input order
+    """
+    return [enrich_row(row) for row in rows]
+
+
+def enrich_positional_rows(
+    rows: List[List[str]],
+    item_type_idx: int,
+    source_file_idx: int,
+    input_width: int,
+    output_width: int,
+    dest_indices: List[int],
+) -> List[List[str]]:
+    """
+    Enrich a chunk of positional CSV rows (csv.reader lists, not dicts).
+
+    The positional path avoids the per-row dict that DictReader/DictWriter
+    allocate and reserialise; rows stay plain lists end to end. Rows are
+    padded or truncated to the input width first so every destination
+    index is valid, matching DictReader's handling of short and long rows.
+
+    Args:
+        rows: List of raw csv.reader rows (already skip-filtered)
+        item_type_idx: Column index of ItemType, or -1 if absent
+        source_file_idx: Column index of ItemSourceFile, or -1 if absent
+        input_width: Number of columns in the input header
+        output_width: Number of columns in the output header
+        dest_indices: Output column index for each ENRICHMENT_COLUMNS value
+
+    Returns:
+        List of enriched positional rows, in input order
+    """
+    pad = [""] * (output_width - input_width)
+    out_rows = []
+    _append = out_rows.append
+    _values = compute_enrichment_values
+    for row in rows:
+        if len(row) != input_width:
+            row = row[:input_width] + [""] * (input_width - len(row))
+        item_type = row[item_type_idx] if item_type_idx >= 0 else ""
+        source_file = row[source_file_idx] if source_file_idx >= 0 else ""
+        out_row = row + pad
+        for dest, value in zip(dest_indices, _values(item_type, source_file)):
+            out_row[dest] = value
+        _append(out_row)
+    return out_rows
 
 
 def ensure_fieldnames_with_appends(original_fieldnames: List[str]) -> List[str]:
@@ -112,7 +252,7 @@ def ensure_fieldnames_with_appends(original_fieldnames: List[str]) -> List[str]:
         Complete list of fieldnames including enrichment columns
     """
     fieldnames = list(original_fieldnames)
-    for c in [MPL_COLUMN, MPL_DESC_COLUMN,ACCOUNT_CODE_COLUMN, ACCOUNT_DESCRIPTION_COLUMN, UOM_COLUMN]:
+    for c in ENRICHMENT_COLUMNS:
         if c not in fieldnames:
             fieldnames.append(c)
     return fieldnames
@@ -129,7 +269,11 @@ def compute_mpl(item_source_file: str) -> str:
     parts = item_source_file.split("-")
     if len(parts) < 3:
         return ""
-    return parts[2].strip()
+    mpl = parts[2]
+    # Only pay the strip allocation when the token is actually padded
+    if mpl and (mpl[0].isspace() or mpl[-1].isspace()):
+        return mpl.strip()
+    return mpl
 
 
 def compute_output_path(input_path: str, explicit_output: str | None = None) -> str:
@@ -156,7 +300,8 @@ def should_skip_row(row: Dict[str, str], fieldnames: List[str]) -> bool:
     """
     Determine if a row should be skipped during processing.
 
-    OPTIMIZED: Uses pre-normalized skip list for faster filtering.
+    OPTIMIZED: Uses a single compiled alternation regex over the pre-normalized
+    skip list so the whole skip check is one C-level search per row.
 
     A row is skipped if:
     1. Neither EntityHandle nor ElementIDValue column exists in the CSV
@@ -184,15 +329,39 @@ def should_skip_row(row: Dict[str, str], fieldnames: List[str]) -> bool:
     if entity_handle != "" and element_id_value != "":
         return True
 
-    # Check if ItemType contains any skip substring
+    # Check if ItemType contains any skip substring (single regex search
+    # against the pre-compiled skip pattern)
     item_type = row.get(INPUT_ITEM_TYPE, "")
-    if item_type:
-        norm_item_type = _normalize_string(item_type)
-        
-        # Use pre-normalized skip list (computed once at module load)
-        for norm_skip_item in normalized_skip_list:
-            if norm_skip_item in norm_item_type:
-                return True
+    if item_type and should_skip(_normalize_string(item_type)):
+        return True
+
+    return False
+
+
+def should_skip_fields(entity_handle: str, element_id_value: str, item_type: str) -> bool:
+    """
+    Positional-path variant of should_skip_row over already-extracted values.
+
+    Applies the same identifier XOR rule and skip-list check as
+    should_skip_row; the caller is responsible for the column-existence
+    check, which is per-file rather than per-row.
 
+    Args:
+        entity_handle: The EntityHandleValue cell ("" when absent)
+        element_id_value: The ElementIDValue cell ("" when absent)
+        item_type: The ItemType cell ("" when absent)
+
+    Returns:
+        True if the row should be skipped, False otherwise
+    """
+    # Exactly one of the two identifiers must be present. isspace()
+    # instead of strip(): the emptiness test needs no new string, so the
+    # common unpadded row allocates nothing here.
+    if (not entity_handle or entity_handle.isspace()) == (
+        not element_id_value or element_id_value.isspace()
+    ):
+        return True
+    if item_type and should_skip(_normalize_string(item_type)):
+        return True
     return False
 
@@ -6,45 +6,99 @@ and UOM data. It serves as the main entry point for the enrichment process.
 """
 
 import argparse
+import codecs
 import csv
+import functools
+import multiprocessing
 import os
+import shutil
 from typing import Optional
 
+# Enriched rows buffered between writerows flushes; amortizes the
+# Python-to-C call overhead of the csv writer
+WRITE_BATCH_SIZE = 10000
+
+# Rows per task when enrichment is fanned out to worker processes; large
+# enough to amortize pickling overhead, small enough to keep workers busy
+PARALLEL_CHUNK_SIZE = 10000
+
+# Bytes sampled from the start of the input for encoding detection; enough
+# to cover the header plus thousands of rows without re-reading the file
+ENCODING_SAMPLE_SIZE = 65536
+
 from helpers import (
-    enrich_row,
     ensure_fieldnames_with_appends,
     compute_output_path,
-    should_skip_row,
-    should_duplicate_row,
+    process_row,
+    process_rows,
     ACCOUNT_CODE_COLUMN,
+    INPUT_ENTITY_HANDLE,
+    INPUT_ELEMENT_ID_VALUE,
 )
 
 
+def _iter_row_chunks(reader, chunk_size=PARALLEL_CHUNK_SIZE):
+    """
+    Yield rows from the reader in fixed-size chunks.
+
+    Args:
+        reader: csv.DictReader over the input file
+        chunk_size: Maximum number of rows per chunk
+
+    Yields:
+        Lists of row dictionaries ready for processing
+    """
+    chunk = []
+    _append = chunk.append
+    for row in reader:
+        _append(row)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+            _append = chunk.append
+    if chunk:
+        yield chunk
+
+
 def detect_file_encoding(file_path: str) -> str:
     """
     Attempt to detect the encoding of a CSV file.
-    
-    Tries multiple common encodings and returns the first one that successfully
-    reads the file. This ensures compatibility with various CSV formats.
-    
+
+    Tries multiple common encodings against a sample from the start of
+    the file and returns the first one that decodes it. Sampling keeps
+    the detection cost constant instead of re-reading the whole file
+    once per candidate encoding.
+
     Args:
         file_path: Path to the CSV file to detect encoding for
-        
+
     Returns:
         The detected encoding name (e.g., 'utf-8-sig', 'utf-8', 'latin1')
     """
+    with open(file_path, 'rb') as f:
+        sample = f.read(ENCODING_SAMPLE_SIZE)
+
+    # A byte-order mark is a definitive signature; no need to trial-decode
+    if sample.startswith(b'\xef\xbb\xbf'):
+        return 'utf-8-sig'
+    if sample.startswith((b'\xff\xfe', b'\xfe\xff')):
+        return 'utf-16'
+
     # Common encodings to try, in order of preference
     encodings_to_try = ['utf-8-sig', 'utf-8', 'latin1', 'cp1252', 'iso-8859-1']
-    
+
+    # A full-size sample may end mid-character; final=False lets the
+    # incremental decoder hold a truncated trailing sequence as pending
+    # state instead of treating it as a wrong encoding
+    final = len(sample) < ENCODING_SAMPLE_SIZE
+
     for encoding in encodings_to_try:
         try:
-            with open(file_path, 'r', encoding=encoding, newline='') as f:
-                # Try to read the entire file to ensure encoding is valid
-                f.read()
+            codecs.getincrementaldecoder(encoding)('strict').decode(sample, final)
             return encoding
         except (UnicodeDecodeError, LookupError):
             continue
-    
+
     # If all encodings fail, default to utf-8 with error handling
     return 'utf-8'
 
@@ -94,17 +148,27 @@ def detect_csv_delimiter(file_path: str, encoding: str) -> str:
         return ','
 
 
-def enrich_csv(input_csv_path: str, output_csv_path: str) -> None:
+def enrich_csv(
+    input_csv_path: str,
+    output_csv_path: str,
+    passthrough_if_enriched: bool = False,
+    jobs: int = 1,
+) -> None:
     """
     Process and enrich a CSV file with additional computed columns.
 
-    Reads the input CSV with auto-detected encoding and delimiter, enriches 
-    each row with MPL, account codes, and UOM, then writes the enriched data 
+    Reads the input CSV with auto-detected encoding and delimiter, enriches
+    each row with MPL, account codes, and UOM, then writes the enriched data
     to an Excel-compatible output CSV with UTF-8-sig encoding.
 
     Args:
         input_csv_path: Path to the input CSV file
         output_csv_path: Path where enriched CSV will be written
+        passthrough_if_enriched: When True and the input header already
+            contains every enrichment column (i.e. a previous run's
+            output), copy the file byte-for-byte instead of re-parsing
+            and re-serializing every row
+        jobs: Number of worker processes to enrich with (1 = in-process)
     """
     # Detect the encoding of the input file
     detected_encoding = detect_file_encoding(input_csv_path)
@@ -115,28 +179,69 @@ def enrich_csv(input_csv_path: str, output_csv_path: str) -> None:
     delimiter_name = {',' : 'comma', ';': 'semicolon', '\t': 'tab'}.get(detected_delimiter, repr(detected_delimiter))
     print(f"Detected input delimiter: {delimiter_name} ({repr(detected_delimiter)})")
     
-    with open(input_csv_path, "r", encoding=detected_encoding, newline="") as infile:
+    # 1 MiB buffers on both ends amortise read()/write() syscalls, which
+    # matters on network filesystems where the exports usually live
+    with open(input_csv_path, "r", encoding=detected_encoding, newline="", buffering=1 << 20) as infile:
         reader = csv.DictReader(infile, delimiter=detected_delimiter)
         if reader.fieldnames is None:
             raise ValueError("Input CSV has no header row")
         fieldnames = ensure_fieldnames_with_appends(reader.fieldnames)
 
+        # Re-run fast path: if the caller asserts the input is already an
+        # enriched output (all enrichment columns present in the header),
+        # a raw byte copy moves it at disk speed with zero per-row work
+        if passthrough_if_enriched and len(fieldnames) == len(reader.fieldnames):
+            print("Input already enriched; copying bytes without re-processing")
+            with open(input_csv_path, "rb") as src, open(output_csv_path, "wb") as dst:
+                shutil.copyfileobj(src, dst, 1 << 20)
+            return
+
         # Write with UTF-8-sig (BOM) and comma delimiter for maximum Excel compatibility
         # This ensures the output can be opened directly in Excel without format conversion
-        with open(output_csv_path, "w", encoding="utf-8-sig", newline="") as outfile:
-            writer = csv.DictWriter(outfile, fieldnames=fieldnames, delimiter=',', extrasaction="ignore")
-            writer.writeheader()
-            for row in reader:
-                if should_skip_row(row, reader.fieldnames):
-                    continue
+        with open(output_csv_path, "w", encoding="utf-8-sig", newline="", buffering=1 << 20) as outfile:
+            # Plain csv.writer over rows projected to the output column
+            # order: DictWriter rehashed every key of every row against
+            # fieldnames, the projection does one .get per output column
+            writer = csv.writer(outfile, delimiter=',')
+            writer.writerow(fieldnames)
+
+            # The identifier columns' presence is invariant for the whole
+            # file; resolve it once instead of scanning the header per row
+            has_identifier_columns = (
+                INPUT_ENTITY_HANDLE in reader.fieldnames
+                or INPUT_ELEMENT_ID_VALUE in reader.fieldnames
+            )
 
-                # Temporary code to copy exisiting rows with ACCOUNT_CODE
-                if should_duplicate_row(row):
-                    writer.writerow(row)
-                    continue
+            if jobs > 1:
+                # Each row is a pure function of its own columns, so
+                # chunks fan out to worker processes; imap streams the
+                # results back in input order for the single writer
+                process_chunk = functools.partial(
+                    process_rows,
+                    has_identifier_columns=has_identifier_columns,
+                    fieldnames=fieldnames,
+                )
+                with multiprocessing.Pool(processes=jobs) as pool:
+                    for enriched_chunk in pool.imap(process_chunk, _iter_row_chunks(reader)):
+                        writer.writerows(enriched_chunk)
+                return
 
-                enriched = enrich_row(row)
-                writer.writerow(enriched)
+            # One fused call per row: skip check, pre-coded copy-through
+            # and enrichment share a single pass over the row. The reader
+            # stays a DictReader because the enrichment logic reads and
+            # mutates a dozen columns by name.
+            _process = process_row
+            batch = []
+            _append = batch.append
+            for row in reader:
+                out_row = _process(row, has_identifier_columns)
+                if out_row is not None:
+                    _append([out_row.get(column, "") for column in fieldnames])
+                    if len(batch) >= WRITE_BATCH_SIZE:
+                        writer.writerows(batch)
+                        batch.clear()
+            if batch:
+                writer.writerows(batch)
 
 def main() -> None:
     """
@@ -151,12 +256,28 @@ def main() -> None:
         required=False,
         help="Optional explicit output CSV path; defaults to <input>_enriched.csv",
     )
+    parser.add_argument(
+        "--passthrough-if-enriched",
+        action="store_true",
+        help="Copy the input byte-for-byte when it already contains all enrichment columns (fast no-op re-runs)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes for enrichment (default: 1)",
+    )
     args = parser.parse_args()
 
     input_path = os.path.abspath(args.input)
     output_path = os.path.abspath(compute_output_path(input_path, args.output))
 
-    enrich_csv(input_path, output_path)
+    enrich_csv(
+        input_path,
+        output_path,
+        passthrough_if_enriched=args.passthrough_if_enriched,
+        jobs=args.jobs,
+    )
     print(f"Wrote enriched CSV: {output_path}")
 
 
@@ -5,9 +5,11 @@ This module contains utility functions used for extracting and computing
 values needed to enrich CSV files with MPL, account codes, and UOM data.
 """
 
+import bisect
+import functools
+import os
 import re
-from fractions import Fraction
-from pathlib import Path
+import sys
 from typing import Dict, List
 
 from constants import (
@@ -47,6 +49,53 @@ from constants import (
 )
 
 
+# Civil3D/ElementSize parsing patterns, compiled once at module scope so the
+# hot path binds pattern objects directly instead of going through the
+# re-module cache on every call
+_RE_INCH_PAREN = re.compile(r"\((\d+(?:\.\d+)?)\s*\"?\)")
+_RE_MM = re.compile(r"(\d+(?:\.\d+)?)\s*mm", re.IGNORECASE)
+_RE_INCH = re.compile(r"(\d+(?:\.\d+)?)\s*\"")
+_RE_LEADING_NUMBER = re.compile(r"^(\d+(?:\.\d+)?)")
+_RE_WHITESPACE = re.compile(r"\s+")
+
+# One case-insensitive alternation over all material keys, used as a C-level
+# prefilter before the Python priority loop: rows without any material
+# mention (the common case) are rejected in a single scan
+_MATERIAL_KEYS_UPPER = tuple(
+    (str(key).upper(), key) for key in material_map if str(key)
+)
+_MATERIAL_RE = re.compile(
+    "|".join(
+        sorted((re.escape(str(key)) for key in material_map if str(key)),
+               key=len, reverse=True)
+    ),
+    re.IGNORECASE,
+)
+
+
+# Inverted material-code index: one upper/strip of the static code lists at
+# import replaces the nested scan (plus per-candidate str/strip/upper) that
+# compute_material_key used to run on every row. setdefault keeps the first
+# key claiming a code, matching the original map-order scan.
+_CODE_TO_KEY: Dict[str, str] = {}
+for _key, _code_values in material_codes_map.items():
+    for _candidate in _code_values:
+        _CODE_TO_KEY.setdefault(str(_candidate).strip().upper(), _key)
+del _key, _code_values, _candidate
+
+# ItemMaterial/ElementMaterial keyword rules with the keywords pre-normalized
+# (lowercased, whitespace removed) once instead of per row
+_ITEM_MATERIAL_RULES = tuple(
+    (tuple(re.sub(r"\s+", "", keyword.lower()) for keyword in keywords), mapped_value)
+    for keywords, mapped_value in ItemMaterial_PlantMaterial_map.items()
+)
+
+# material_keys_list with pre-uppercased needles for the ItemType scan
+_MATERIAL_KEYS_LIST_UPPER = tuple(
+    (str(key).upper(), key) for key in material_keys_list
+)
+
+
 def compute_mpl(item_source_file: str) -> str:
     """
     Extract MPL code from ItemSourceFile.
@@ -62,13 +111,52 @@ def compute_mpl(item_source_file: str) -> str:
     parts = item_source_file.split("-")
     if len(parts) < 3:
         return ""
-    return parts[2].strip()
+    mpl = parts[2]
+    # Only pay the strip allocation when the token is actually padded
+    if mpl and (mpl[0].isspace() or mpl[-1].isspace()):
+        return mpl.strip()
+    return mpl
+
+
+@functools.lru_cache(maxsize=4096)
+def _mpl_and_desc(item_source_file: str) -> tuple:
+    """
+    Compute (mpl, mpl_description) for one ItemSourceFile value, memoized.
+
+    Real exports draw ItemSourceFile from a handful of distinct files, so
+    after warmup the per-row cost is one hash probe on the raw value
+    instead of a split plus an mpl_map lookup.
+
+    Args:
+        item_source_file: The ItemSourceFile value from the input row
+
+    Returns:
+        (mpl_code, mpl_description) tuple; both "" when not found
+    """
+    mpl_value = compute_mpl(item_source_file)
+    return mpl_value, mpl_map.get(mpl_value, "")
+
+
+# Size-range buckets as parallel arrays for a bisect lookup: upper bounds,
+# the matching lower bounds, and the labels. A binary search over the upper
+# bounds replaces the eight-branch comparison ladder per row.
+_SIZE_RANGE_UPPER = (6, 12, 24, 40, 54, 72, 90)
+_SIZE_RANGE_LOWER = (2.5, 8, 14, 26, 42, 60, 74)
+_SIZE_RANGE_LABELS = (
+    "2.5\"-6\"", "8\"-12\"", "14\"-24\"", "26\"-40\"",
+    "42\"-54\"", "60\"-72\"", "74\"-90\"",
+)
 
 
 def compute_pipe_size_range(size: float | None) -> str | None:
     """
     Determine the pipe size range category.
 
+    A bisect over the bucket upper bounds finds the candidate range in
+    O(log k); the lower-bound check then rejects sizes that fall in the
+    gaps between ranges (e.g. 6.5 or 13), exactly as the old comparison
+    ladder did.
+
     Args:
         size: The pipe size in inches
 
@@ -77,25 +165,45 @@ def compute_pipe_size_range(size: float | None) -> str | None:
     """
     if size is None:
         return None
-    if 2.5 <= size <= 6:
-        return "2.5\"-6\""
-    if 8 <= size <= 12:
-        return "8\"-12\""
-    if 14 <= size <= 24:
-        return "14\"-24\""
-    if 26 <= size <= 40:
-        return "26\"-40\""
-    if 42 <= size <= 54:
-        return "42\"-54\""
-    if 60 <= size <= 72:
-        return "60\"-72\""
-    if 74 <= size <= 90:
-        return "74\"-90\""
-    if size > 90:
-        return ">90\""
+    index = bisect.bisect_left(_SIZE_RANGE_UPPER, size)
+    if index == len(_SIZE_RANGE_UPPER):
+        return ">90\"" if size > 90 else None
+    if size >= _SIZE_RANGE_LOWER[index]:
+        return _SIZE_RANGE_LABELS[index]
     return None
 
 
+def _parse_fraction_text(text: str) -> float:
+    """
+    Parse "3/4"-style fraction text (or a plain number) into a float.
+
+    Replicates fractions.Fraction string parsing for the inputs this
+    pipeline sees without constructing Fraction objects: an integer
+    numerator and denominator around a single slash, with no whitespace
+    touching the slash.
+
+    Args:
+        text: The fraction (or plain number) text
+
+    Returns:
+        The parsed value as a float
+
+    Raises:
+        ValueError or ZeroDivisionError on malformed or zero-denominator text
+    """
+    if '/' not in text:
+        return float(text)
+    numerator, _, denominator = text.partition('/')
+    # Fraction rejects whitespace around the slash; int() would not
+    if numerator != numerator.rstrip() or denominator != denominator.lstrip():
+        raise ValueError(f"invalid fraction: {text!r}")
+    # Fraction only allows a sign on the numerator; int() would accept
+    # "3/-4" and silently flip the sign of the size
+    if denominator[:1] in ('+', '-'):
+        raise ValueError(f"invalid fraction: {text!r}")
+    return int(numerator) / int(denominator)
+
+
 def parse_autocad_size(value):
     """
     Parse AutoCAD size values that may include fractions.
@@ -116,20 +224,27 @@ def parse_autocad_size(value):
 
     value = value.replace('"', '').strip()
 
+    # Fast path: a plain decimal like "2.5" is the overwhelmingly common
+    # case, and it needs exactly one C-level float parse - no split, no
+    # fraction machinery
+    if '/' not in value and ' ' not in value:
+        try:
+            return float(value)
+        except ValueError:
+            return None
+
     # Handle mixed numbers (e.g., "2 1/2")
     if ' ' in value:
         parts = value.split()
         try:
-            whole = float(parts[0])
-            frac = float(Fraction(parts[1]))
-            return whole + frac
+            return float(parts[0]) + _parse_fraction_text(parts[1])
         except Exception:
             pass
 
     # Handle fractions (e.g., "3/4")
     if '/' in value:
         try:
-            return float(Fraction(value))
+            return _parse_fraction_text(value)
         except Exception:
             pass
 
@@ -140,7 +255,16 @@ def parse_autocad_size(value):
         return None
 
 
-def compute_account_description(row: Dict[str, str]) -> str:
+def compute_account_description(
+    row: Dict[str, str],
+    # Hot-path globals bound as defaults at definition time: LOAD_FAST
+    # beats LOAD_GLOBAL on every per-row call. Positional callers are
+    # unaffected; the names are private by convention.
+    _material_get=material_map.get,
+    _z_key=INPUT_AUTOCAD_COG_Z,
+    _size_key=INPUT_AUTOCAD_SIZE,
+    _mat_key=INPUT_AUTOCAD_PLANT_MATERIAL,
+) -> str:
     """
     Compute the account code description based on row data.
 
@@ -164,14 +288,14 @@ def compute_account_description(row: Dict[str, str]) -> str:
 
     if ItemType == "Pressure Pipe" or ItemSourceFileCode in ["CUW"]:
         # Set default values for Pressure Pipe
-        row[INPUT_AUTOCAD_COG_Z] = float('-inf')
-        row[INPUT_AUTOCAD_SIZE] = compute_size_from_civil3dInfo(row.get(INPUT_CIVIL3D_INFO))
-        row[INPUT_AUTOCAD_PLANT_MATERIAL] = compute_material_from_civil3dInfo(row.get(INPUT_CIVIL3D_INFO))
-    
+        row[_z_key] = float('-inf')
+        row[_size_key] = compute_size_from_civil3dInfo(row.get(INPUT_CIVIL3D_INFO))
+        row[_mat_key] = compute_material_from_civil3dInfo(row.get(INPUT_CIVIL3D_INFO))
+
     missing_values = []
-    
+
     # Step 1: Check material first
-    material_key = row.get(INPUT_AUTOCAD_PLANT_MATERIAL)
+    material_key = row.get(_mat_key)
     material_name = None
     if material_key in (None, ""):
         # Fallback: try to infer from material code column
@@ -180,7 +304,7 @@ def compute_account_description(row: Dict[str, str]) -> str:
             material_key = inferred_key
     
     if material_key not in (None, ""):
-        material_name = material_map.get(material_key)
+        material_name = _material_get(material_key)
         if material_name is not None and str(material_name).strip() == "":
             material_name = None
     
@@ -192,7 +316,7 @@ def compute_account_description(row: Dict[str, str]) -> str:
     
     # Step 2: Check size (try AutoCADSize, then fallback to ElementSize)
     size_val = None
-    size_raw = row.get(INPUT_AUTOCAD_SIZE)
+    size_raw = row.get(_size_key)
     if size_raw not in (None, ""):
         size_val = parse_autocad_size(size_raw)
 
@@ -220,7 +344,7 @@ def compute_account_description(row: Dict[str, str]) -> str:
     if is_element_id_value_present:
         z_raw = row.get(INPUT_MAXZ)
     else:
-        z_raw = row.get(INPUT_AUTOCAD_COG_Z)
+        z_raw = row.get(_z_key)
 
     z_val = None
     if z_raw in (None, ""):
@@ -266,36 +390,55 @@ def compute_pipe_description(is_above_ground: bool, is_small_bore: bool, size_va
     Returns:
         Formatted pipe description string
     """
+    # size_val only matters through its range bucket, so the description
+    # is a function of a tiny key space: 2 x 2 x 9 ranges x ~10 materials.
+    # Memoizing on that key builds each distinct string once instead of
+    # re-running the f-string formatting on every row.
+    return _pipe_description(
+        is_above_ground,
+        is_small_bore,
+        compute_pipe_size_range(size_val) if not is_small_bore else None,
+        material_name,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _pipe_description(
+    is_above_ground: bool,
+    is_small_bore: bool,
+    size_range: str | None,
+    material_name: str | None,
+) -> str:
+    """
+    Build the description string for one (location, bore, range, material)
+    key. Cached without bound: the key space is a few hundred entries at
+    most, one per distinct description the pipeline can emit. Results are
+    interned so the piping_map probe downstream works on the canonical
+    object with its hash already cached.
+    """
     if is_above_ground:
         if is_small_bore:
-            return (
+            description = (
                 "Above Ground Small Bore Pipe (All-In) (0-2\")"
                 if material_name is None
                 else f"Above Ground Small Bore Pipe (All-In) ({material_name})"
             )
-        size_range = compute_pipe_size_range(size_val)
-        if size_range is None:
-            return "Above Ground Large Bore Pipe"
-        return (
-            f"Above Ground Large Bore Pipe ({material_name}) ({size_range} Diameter)"
-            if material_name is not None
-            else "Above Ground Large Bore Pipe"
-        )
+        elif size_range is None or material_name is None:
+            description = "Above Ground Large Bore Pipe"
+        else:
+            description = f"Above Ground Large Bore Pipe ({material_name}) ({size_range} Diameter)"
     else:
         if is_small_bore:
-            return (
+            description = (
                 "Underground Small Bore Pipe"
                 if material_name is None
                 else f"Underground Small Bore Pipe - {material_name}"
             )
-        size_range = compute_pipe_size_range(size_val)
-        if size_range is None:
-            return "Underground Large Bore Pipe"
-        return (
-            f"Underground Large Bore Pipe ({material_name}) ({size_range} Diameter)"
-            if material_name is not None
-            else "Underground Large Bore Pipe"
-        )
+        elif size_range is None or material_name is None:
+            description = "Underground Large Bore Pipe"
+        else:
+            description = f"Underground Large Bore Pipe ({material_name}) ({size_range} Diameter)"
+    return sys.intern(description)
 
 def compute_material_key(material_code_value: str, item_material_value: str, item_type_value: str, element_material_value: str, is_element_id_value_present: bool) -> str:
     """
@@ -314,35 +457,34 @@ def compute_material_key(material_code_value: str, item_material_value: str, ite
 
     # CASE 1: IN CASE OF ELEMENT ID DATA, WE NEED TO DERIVE MATERIAL FROM ELEMENT MATERIAL COLUMN
     if is_element_id_value_present and element_material_value not in (None, ""):
-        normalized = re.sub(r"\s+", "", str(element_material_value).lower())
-        for keywords, mapped_value in ItemMaterial_PlantMaterial_map.items():
+        normalized = _RE_WHITESPACE.sub("", str(element_material_value).lower())
+        for norm_keywords, mapped_value in _ITEM_MATERIAL_RULES:
             # Ensure all keywords appear (as substrings) in the normalized text
-            if all(re.sub(r"\s+", "", k.lower()) in normalized for k in keywords):
+            if all(keyword in normalized for keyword in norm_keywords):
                 return mapped_value
 
 
     # CASE 2: IN CASE OF ENTITY HANDLE DATA, WE NEED TO DERIVE MATERIAL BASED ON 3 COLUMNS: MATERIAL CODE, ITEM MATERIAL, AND ITEM TYPE
-    # Try to derive material key from material code
+    # Try to derive material key from material code: a single probe of the
+    # inverted index instead of a nested scan over every code list
     if material_code_value:
-        needle = str(material_code_value).strip().upper()
-        for key, code_values in material_codes_map.items():
-            for candidate in code_values:
-                if needle == str(candidate).strip().upper():
-                    return key
-                
+        key = _CODE_TO_KEY.get(str(material_code_value).strip().upper())
+        if key is not None:
+            return key
+
     # Try to derive material key from item material using keyword lists
     if item_material_value:
-        normalized = re.sub(r"\s+", "", str(item_material_value).lower())
-        for keywords, mapped_value in ItemMaterial_PlantMaterial_map.items():
+        normalized = _RE_WHITESPACE.sub("", str(item_material_value).lower())
+        for norm_keywords, mapped_value in _ITEM_MATERIAL_RULES:
             # Ensure all keywords appear (as substrings) in the normalized text
-            if all(re.sub(r"\s+", "", k.lower()) in normalized for k in keywords):
+            if all(keyword in normalized for keyword in norm_keywords):
                 return mapped_value
 
     # 3) Inspect item_type_value for any material key substring
     if item_type_value:
         up = str(item_type_value).upper()
-        for key in material_keys_list:
-            if str(key).upper() in up:
+        for key_upper, key in _MATERIAL_KEYS_LIST_UPPER:
+            if key_upper in up:
                 return key
 
     # No material key found
@@ -365,7 +507,7 @@ def compute_size_from_civil3dInfo(civil3dInfo: str) -> str:
     text = civil3dInfo.strip()
 
     # 1) Prefer explicit inches in parentheses, e.g. (4")
-    match_in_parentheses = re.search(r"\((\d+(?:\.\d+)?)\s*\"?\)", text)
+    match_in_parentheses = _RE_INCH_PAREN.search(text)
     if match_in_parentheses:
         inches_val = float(match_in_parentheses.group(1))
         return f"{inches_val:g}\""
@@ -374,7 +516,7 @@ def compute_size_from_civil3dInfo(civil3dInfo: str) -> str:
     normalized = text.replace("mmØ", "mm").replace("Ø", "")
 
     # 3) Extract first number followed by mm
-    match_mm = re.search(r"(\d+(?:\.\d+)?)\s*mm", normalized, flags=re.IGNORECASE)
+    match_mm = _RE_MM.search(normalized)
     if match_mm:
         mm_val = float(match_mm.group(1))
         inches = mm_val / 25.4
@@ -385,7 +527,7 @@ def compute_size_from_civil3dInfo(civil3dInfo: str) -> str:
         return f"{rounded:.1f}\""
 
     # 4) Fallback: look for a bare inches number with a quote not in parentheses
-    match_inch = re.search(r"(\d+(?:\.\d+)?)\s*\"", text)
+    match_inch = _RE_INCH.search(text)
     if match_inch:
         inches_val = float(match_inch.group(1))
         return f"{inches_val:g}\""
@@ -404,10 +546,16 @@ def compute_material_from_civil3dInfo(civil3dInfo: str) -> str:
     if not civil3dInfo:
         return ""
 
+    # C-level prefilter: most rows mention no material at all, and one
+    # alternation scan rejects them without touching the priority loop
+    if _MATERIAL_RE.search(civil3dInfo) is None:
+        return ""
+
+    # Priority is material_map insertion order, so resolve hits with the
+    # pre-uppercased key list rather than the leftmost regex match
     text_upper = civil3dInfo.upper()
-    for material_key in material_map.keys():
-        key_upper = str(material_key).upper()
-        if key_upper and key_upper in text_upper:
+    for key_upper, material_key in _MATERIAL_KEYS_UPPER:
+        if key_upper in text_upper:
             return material_key
 
     return ""
@@ -434,12 +582,12 @@ def compute_size_from_element_size(element_size_raw: str | None) -> float | None
     if not element_size_raw:
         return None
 
-    text = re.sub(r"\s+", "", str(element_size_raw))
+    text = _RE_WHITESPACE.sub("", str(element_size_raw))
     if text == "":
         return None
 
     # Extract leading numeric with optional decimal
-    m = re.match(r"^(\d+(?:\.\d+)?)", text)
+    m = _RE_LEADING_NUMBER.match(text)
     if not m:
         return None
     try:
@@ -516,33 +664,120 @@ def should_duplicate_row(row: Dict[str, str]) -> bool:
         return False
     return True
 
-def enrich_row(row: Dict[str, str]) -> Dict[str, str]:
+def enrich_row(
+    row: Dict[str, str],
+    # Hot-path globals bound as defaults at definition time (see
+    # compute_account_description)
+    _piping_get=piping_map.get,
+    _src_key=INPUT_ITEM_SOURCE_FILE,
+) -> Dict[str, str]:
     """
     Enrich a single CSV row with computed values.
 
     Adds MPL, MPL_DESCRIPTION, ACCOUNT_CODE, ACCOUNT_CODE_DESCRIPTION,
     and UOM columns to the row.
 
+    The input dict is mutated in place and returned: each DictReader row
+    is fresh and never reused by the caller, so copying it first only
+    doubled the per-row dict allocations (compute_account_description
+    already wrote the CLEAN_* columns through to the original anyway).
+
     Args:
-        row: Dictionary containing the original CSV row data
+        row: Dictionary containing the original CSV row data; consumed
 
     Returns:
-        Dictionary with original data plus enriched fields
+        The same dictionary with the enriched fields added
     """
-    item_source_file = row.get(INPUT_ITEM_SOURCE_FILE, "")
-    mpl_value = compute_mpl(item_source_file)
-    mpl_desc_value = mpl_map.get(mpl_value, "")
+    item_source_file = row.get(_src_key, "")
+    mpl_value, mpl_desc_value = _mpl_and_desc(item_source_file)
 
     account_code_desc_value = compute_account_description(row)
-    account_code_value = piping_map.get(account_code_desc_value, "")
+    account_code_value = _piping_get(account_code_desc_value, "")
+
+    row[MPL_COLUMN] = mpl_value
+    row[MPL_DESC_COLUMN] = mpl_desc_value
+    row[ACCOUNT_CODE_COLUMN] = account_code_value
+    row[ACCOUNT_CODE_DESC_COLUMN] = account_code_desc_value
+    row[UOM_COLUMN] = DEFAULT_UOM
+    return row
+
+
+def process_row(row: Dict[str, str], has_identifier_columns: bool) -> Dict[str, str] | None:
+    """
+    Run the whole per-row pipeline - skip check, duplicate check,
+    enrichment - in a single pass.
+
+    Fusing the three steps reads each input column exactly once instead
+    of once per helper, so the hot loop in enrich_csv does one call and
+    one branch per row.
+
+    Args:
+        row: Dictionary containing the CSV row data
+        has_identifier_columns: Whether the CSV has EntityHandleValue or
+            ElementIDValue in its header; invariant per file, so the
+            caller computes it once instead of scanning fieldnames per row
+
+    Returns:
+        The row to write (the original dict for pre-coded rows that are
+        copied through, the enriched dict otherwise), or None when the
+        row should be skipped
+    """
+    # Without either identifier column every row is skipped
+    if not has_identifier_columns:
+        return None
+
+    # Exactly one of the two identifiers must be present. isspace()
+    # instead of strip(): the emptiness test needs no new string, so the
+    # common unpadded row allocates nothing here.
+    entity_handle = row.get(INPUT_ENTITY_HANDLE, "")
+    element_id_value = row.get(INPUT_ELEMENT_ID_VALUE, "")
+    if (not entity_handle or entity_handle.isspace()) == (
+        not element_id_value or element_id_value.isspace()
+    ):
+        return None
+
+    # Rows that already carry an ACCOUNT_CODE are copied through unchanged
+    account_code = row.get(ACCOUNT_CODE_COLUMN, "")
+    if not isinstance(account_code, str):
+        account_code = str(account_code)
+    if account_code and not account_code.isspace():
+        return row
 
-    enriched = dict(row)
-    enriched[MPL_COLUMN] = mpl_value
-    enriched[MPL_DESC_COLUMN] = mpl_desc_value
-    enriched[ACCOUNT_CODE_COLUMN] = account_code_value
-    enriched[ACCOUNT_CODE_DESC_COLUMN] = account_code_desc_value
-    enriched[UOM_COLUMN] = DEFAULT_UOM
-    return enriched
+    return enrich_row(row)
+
+
+def process_rows(
+    rows: List[Dict[str, str]],
+    has_identifier_columns: bool,
+    fieldnames: List[str],
+) -> List[List[str]]:
+    """
+    Run process_row over a chunk of rows and project the survivors.
+
+    Top-level entry point for multiprocessing workers. The lookup maps
+    and compiled regexes live at module level, so forked workers inherit
+    them copy-on-write instead of rebuilding or shipping them per task.
+    Returning positional lists keeps the parent's write loop identical
+    to the serial path.
+
+    Args:
+        rows: List of CSV row dictionaries from the reader
+        has_identifier_columns: Whether the CSV header has either
+            identifier column; invariant per file
+        fieldnames: Output column names, in write order
+
+    Returns:
+        Enriched rows projected to the output column order, in input
+        order, with skipped rows dropped
+    """
+    _process = process_row
+    out_rows = []
+    _append = out_rows.append
+    for row in rows:
+        out_row = _process(row, has_identifier_columns)
+        if out_row is not None:
+            _append([out_row.get(column, "") for column in fieldnames])
+    return out_rows
 
 
 def ensure_fieldnames_with_appends(original_fieldnames: List[str]) -> List[str]:
@@ -580,6 +815,6 @@ def compute_output_path(input_path: str, explicit_output: str | None = None) ->
     """
     if explicit_output:
         return explicit_output
-    p = Path(input_path)
-    return str(p.with_name(f"{p.stem}_enriched{p.suffix}"))
+    root, ext = os.path.splitext(input_path)
+    return f"{root}_enriched{ext}"
 